@@ -1,8 +1,17 @@
-from typing import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from mmap import mmap, ACCESS_READ
+from os import cpu_count, path
+from typing import Dict, Iterable, Iterator, List, TextIO, Tuple, Union
+import numpy as np
 
 
-def get_input() -> Iterable[int]:
-    return [int(num) for num in open("Day_01_input.txt").readlines()]
+def get_input(input_file: str = "Day_01_input.txt") -> Iterable[int]:
+    return [int(num) for num in open(input_file).readlines()]
+
+
+# Reads the depths straight into an int64 array, without building a Python list first
+def get_input_array(input_file: str = "Day_01_input.txt") -> np.ndarray:
+    return np.fromfile(input_file, dtype=np.int64, sep=" ")
 
 
 # Determine the number of times the depth increases. Answers Part 1
@@ -28,6 +37,175 @@ def increase_count_three_depths(depths: int) -> int:
     return increases
 
 
+# Determine the number of times the depth increases on a sliding window sum of any size, using vectorized comparisons.
+# Two neighbouring windows share all but their first and last depths, so the sum increases exactly when depths[i + window] > depths[i].
+# A window of 1 answers Part 1, and a window of 3 answers Part 2
+def increase_count_window(depths: np.ndarray, window: int = 1) -> int:
+    if window < 1:
+        raise ValueError("The window size must be at least 1")
+    depths = np.asarray(depths, dtype=np.int64)
+    if len(depths) <= window:
+        return 0
+    return int(np.count_nonzero(depths[window:] > depths[:-window]))
+
+
+# Keeps running increase counts for several window sizes over a stream of depths, in constant memory.
+# Only the last (largest window) depths are kept, in a ring buffer, as depths[i + window] only needs to be compared with depths[i]
+class DepthIncreaseCounter:
+    def __init__(self, windows: Iterable[int] = (1, 3)):
+        self._windows = sorted(set(windows))
+        if len(self._windows) == 0 or self._windows[0] < 1:
+            raise ValueError("The window sizes must be at least 1")
+        self._ring = [0] * self._windows[-1]
+        self._position = 0
+        self._seen = 0
+        self._counts = {window: 0 for window in self._windows}
+
+    def add_depth(self, depth: int):
+        size = len(self._ring)
+        for window in self._windows:
+            if self._seen >= window:
+                if self._ring[(self._position - window) % size] < depth:
+                    self._counts[window] += 1
+        self._ring[self._position] = depth
+        self._position = (self._position + 1) % size
+        self._seen += 1
+
+    def add_depths(self, depths: Iterable[int]):
+        for depth in depths:
+            self.add_depth(depth)
+
+    def get_counts(self) -> Dict[int, int]:
+        return dict(self._counts)
+
+    def get_depth_count(self) -> int:
+        return self._seen
+
+
+# Reads depths one at a time from a file path, an open file handle, or any iterable of depths (or lines).
+# File handles are read in chunks of chunk_size characters, so a line is never read all at once
+def read_depths(
+    source: Union[str, TextIO, Iterable], chunk_size: int = 1 << 16
+) -> Iterator[int]:
+    if isinstance(source, str):
+        with open(source) as file:
+            yield from read_depths(file, chunk_size=chunk_size)
+        return
+
+    if not hasattr(source, "read"):
+        for depth in source:
+            yield int(depth)
+        return
+
+    # The last line of a chunk may be cut off, so it is carried over to the next chunk
+    leftover = ""
+    chunk = source.read(chunk_size)
+    while chunk:
+        lines = (leftover + chunk).split("\n")
+        leftover = lines.pop()
+        for line in lines:
+            if line.strip():
+                yield int(line)
+        chunk = source.read(chunk_size)
+    if leftover.strip():
+        yield int(leftover)
+
+
+# Counts the increases for several window sizes in one pass over a stream of depths, yielding the running counts
+# every report_every depths and once more at the end of the stream. Memory use does not depend on the length of the stream
+def stream_increase_counts(
+    source: Union[str, TextIO, Iterable],
+    windows: Iterable[int] = (1, 3),
+    report_every: int = 1 << 16,
+) -> Iterator[Dict[int, int]]:
+    counter = DepthIncreaseCounter(windows=windows)
+    for depth in read_depths(source):
+        counter.add_depth(depth)
+        if counter.get_depth_count() % report_every == 0:
+            yield counter.get_counts()
+    if counter.get_depth_count() % report_every != 0 or counter.get_depth_count() == 0:
+        yield counter.get_counts()
+
+
+# Splits a file into (start, end) byte ranges of about the same size. Every range ends just after a newline
+# (or at the end of the file), so no depth is cut in two
+def split_line_ranges(input_file: str, count: int) -> List[Tuple[int, int]]:
+    # An empty file cannot be memory-mapped, and has no depths anyway
+    if path.getsize(input_file) == 0:
+        return []
+    with open(input_file, "rb") as file:
+        with mmap(file.fileno(), 0, access=ACCESS_READ) as depth_map:
+            size = len(depth_map)
+            boundaries = [0]
+            for i in range(1, count):
+                newline = depth_map.find(b"\n", max(size * i // count, boundaries[-1]))
+                if newline == -1:
+                    break
+                if newline + 1 > boundaries[-1]:
+                    boundaries.append(newline + 1)
+            if boundaries[-1] < size:
+                boundaries.append(size)
+    return list(zip(boundaries[:-1], boundaries[1:]))
+
+
+# Counts the increases inside a single byte range of the file. Also returns the first and last (window) depths of the range,
+# so that the increases across the range boundaries can be counted afterwards. Runs in a worker process
+def count_range_increases(
+    input_file: str, start: int, end: int, window: int
+) -> Tuple[int, np.ndarray, np.ndarray]:
+    with open(input_file, "rb") as file:
+        with mmap(file.fileno(), 0, access=ACCESS_READ) as depth_map:
+            depths = np.fromstring(depth_map[start:end], dtype=np.int64, sep=" ")
+    return (
+        increase_count_window(depths, window=window),
+        depths[:window].copy(),
+        depths[-window:].copy(),
+    )
+
+
+# Determine the number of times the depth increases on a sliding window sum, counting each part of a memory-mapped file in its own process.
+# The increases inside each range are counted by the workers. An increase across a boundary compares one of the last (window) depths
+# seen so far with one of the first (window) depths of the next range, so those are stitched together here.
+# Gives the same answer as increase_count_one_depth for a window of 1, and increase_count_three_depths for a window of 3
+def increase_count_parallel(
+    input_file: str = "Day_01_input.txt",
+    window: int = 3,
+    processes: int = None,
+    chunks: int = None,
+) -> int:
+    if window < 1:
+        raise ValueError("The window size must be at least 1")
+    processes = processes or cpu_count() or 1
+    ranges = split_line_ranges(input_file, chunks or processes * 4)
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        results = list(
+            executor.map(
+                count_range_increases,
+                [input_file] * len(ranges),
+                [start for start, end in ranges],
+                [end for start, end in ranges],
+                [window] * len(ranges),
+            )
+        )
+
+    increases = 0
+    tail = np.empty(0, dtype=np.int64)
+    for count, head, last in results:
+        increases += count
+
+        # Only pairs that start in the tail and end in the head cross the boundary
+        joined = np.concatenate([tail, head])
+        if len(joined) > window:
+            crossing = joined[window:] > joined[:-window]
+            increases += int(np.count_nonzero(crossing[: len(tail)]))
+
+        # A range can hold fewer depths than the window, so the tail may span several ranges
+        tail = np.concatenate([tail, last])[-window:]
+
+    return increases
+
+
 def main():
     depthList = get_input()
     print("Part 1 Answer:", increase_count_one_depth(depths=depthList))
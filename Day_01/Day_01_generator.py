@@ -0,0 +1,32 @@
+from random import Random
+from sys import argv
+
+
+def generate_input(scale: int = 1, seed: int = 0) -> str:
+    """
+    Generates a list of depth readings. The depths follow a random walk that mostly goes deeper, like the puzzle input.
+
+    Args:
+        scale (int, optional): The size of the input compared to the puzzle input (2000 readings). Defaults to 1.
+        seed (int, optional): The seed for the random number generator. Defaults to 0.
+
+    Returns:
+        str: The contents of an input file
+    """
+    rng = Random(seed)
+    depth = rng.randint(100, 200)
+    lines = []
+    for i in range(0, 2000 * scale):
+        depth = max(0, depth + rng.randint(-10, 20))
+        lines.append(f"{depth}\n")
+    return "".join(lines)
+
+
+def main():
+    # The scale can be given as the first argument (ex. "python Day_01_generator.py 100 > input.txt")
+    scale = int(argv[1]) if len(argv) > 1 else 1
+    print(generate_input(scale=scale), end="")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,25 @@
-from typing import Iterable
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from os import cpu_count
+from typing import Iterable, Tuple
+import numpy as np
+
+# The opcode for each direction, used when the commands are stored as arrays
+OPCODES = {"forward": 0, "down": 1, "up": 2}
+FORWARD, DOWN, UP = 0, 1, 2
+
+# Maps the first letter of a command to its opcode. 255 marks bytes that do not start a command
+OPCODE_TABLE = np.full(256, 255, dtype=np.uint8)
+for name, opcode in OPCODES.items():
+    OPCODE_TABLE[ord(name[0])] = opcode
+
+# The effect of a run of commands on a ship that starts at (horizontal, depth, aim) = (0, 0, 0).
+# Because every command is an affine update, a run of commands moves any ship from (h, d, a) to
+# (h + horizontal, d + depth + a * forward, a + aim) with aim enabled, or (h + horizontal, d + depth, a) without it
+CourseTransform = namedtuple(
+    "CourseTransform", ["horizontal", "depth", "aim", "forward"]
+)
+
 
 # Represents the current position. If aim is not enabled, the depth changes with "down" or "up" commands. If aim is enabled, the depth changes only with "forward" commands
 class ShipPosition:
@@ -25,6 +46,20 @@ class ShipPosition:
         else:
             self._depth -= quantity
 
+    # Applies a whole column of commands at once, a chunk at a time so that the temporary arrays stay small
+    def move_columns(
+        self, opcodes: np.ndarray, quantities: np.ndarray, chunk_size: int = 1 << 22
+    ):
+        for start in range(0, len(opcodes), chunk_size):
+            transform = get_course_transform(
+                opcodes[start : start + chunk_size],
+                quantities[start : start + chunk_size],
+                self._enable_aim,
+            )
+            self._horizontal += transform.horizontal
+            self._depth += transform.depth + self._aim * transform.forward
+            self._aim += transform.aim
+
     def get_horizontal(self):
         return self._horizontal
 
@@ -45,10 +80,10 @@ class Direction:
         return self._quantity
 
 
-def get_input() -> Iterable[Direction]:
+def get_input(input_file: str = "Day_02_input.txt") -> Iterable[Direction]:
     return [
         Direction(direction.split(" ")[0], direction.split(" ")[1])
-        for direction in open("Day_02_input.txt").readlines()
+        for direction in open(input_file).readlines()
     ]
 
 
@@ -65,6 +100,141 @@ def get_final_position(
     return ship_position.get_horizontal() * ship_position.get_depth()
 
 
+# Parses the input file straight into a uint8 opcode column and an int32 quantity column, without creating an object per line.
+# The opcode comes from the first byte of each line. The quantities are parsed in one call once all letters are removed
+def get_input_columns(
+    input_file: str = "Day_02_input.txt",
+) -> Tuple[np.ndarray, np.ndarray]:
+    with open(input_file, "rb") as file:
+        data = file.read()
+
+    buffer = np.frombuffer(data, dtype=np.uint8)
+    line_starts = np.concatenate(([0], np.flatnonzero(buffer == ord("\n")) + 1))
+    line_starts = line_starts[line_starts < len(buffer)]
+    opcodes = OPCODE_TABLE[buffer[line_starts]]
+
+    # Blank lines have no command and no quantity
+    opcodes = opcodes[opcodes != 255]
+
+    quantities = np.fromstring(
+        data.translate(None, b"abcdefghijklmnopqrstuvwxyz"), dtype=np.int32, sep=" "
+    )
+    if len(quantities) != len(opcodes):
+        raise ValueError("Every command must have exactly one quantity")
+    return opcodes, quantities
+
+
+# Converts a list of Direction objects into an opcode array and a quantity array
+def encode_directions(directions: Iterable[Direction]) -> Tuple[np.ndarray, np.ndarray]:
+    opcodes = np.array(
+        [OPCODES[direction.get_direction()] for direction in directions], dtype=np.uint8
+    )
+    quantities = np.array(
+        [direction.get_quantity() for direction in directions], dtype=np.int64
+    )
+    return opcodes, quantities
+
+
+# Returns the position after every command as an (n, 3) array of (horizontal, depth, aim), using prefix sums instead of a loop.
+# With aim enabled, the aim at each command is the prefix sum of the "down" and "up" quantities, and the depth is the prefix sum of
+# aim * quantity over the "forward" commands. Without aim, the depth is the prefix sum of the "down" and "up" quantities
+def get_trajectory(
+    opcodes: np.ndarray, quantities: np.ndarray, enable_aim: bool = False
+) -> np.ndarray:
+    quantities = np.asarray(quantities, dtype=np.int64)
+    forward = np.where(opcodes == FORWARD, quantities, 0)
+    vertical = np.where(opcodes == DOWN, quantities, 0) - np.where(
+        opcodes == UP, quantities, 0
+    )
+
+    trajectory = np.empty((len(opcodes), 3), dtype=np.int64)
+    np.cumsum(forward, out=trajectory[:, 0])
+    if enable_aim:
+        np.cumsum(vertical, out=trajectory[:, 2])
+        np.cumsum(forward * trajectory[:, 2], out=trajectory[:, 1])
+    else:
+        np.cumsum(vertical, out=trajectory[:, 1])
+        trajectory[:, 2] = 0
+    return trajectory
+
+
+# Reduces a run of commands to a single CourseTransform
+def get_course_transform(
+    opcodes: np.ndarray, quantities: np.ndarray, enable_aim: bool = False
+) -> CourseTransform:
+    quantities = np.asarray(quantities, dtype=np.int64)
+    forward = np.where(opcodes == FORWARD, quantities, 0)
+    vertical = np.where(opcodes == DOWN, quantities, 0) - np.where(
+        opcodes == UP, quantities, 0
+    )
+    total_forward = int(forward.sum())
+    if enable_aim:
+        return CourseTransform(
+            horizontal=total_forward,
+            depth=int((forward * np.cumsum(vertical)).sum()),
+            aim=int(vertical.sum()),
+            forward=total_forward,
+        )
+    return CourseTransform(
+        horizontal=total_forward,
+        depth=int(vertical.sum()),
+        aim=0,
+        forward=total_forward,
+    )
+
+
+# Combines two transforms into the transform of the first run of commands followed by the second.
+# This is associative, so runs can be reduced separately and combined in order
+def combine_transforms(
+    first: CourseTransform, second: CourseTransform
+) -> CourseTransform:
+    return CourseTransform(
+        horizontal=first.horizontal + second.horizontal,
+        # The second run's forward commands are steered by the aim built up during the first run
+        depth=first.depth + second.depth + first.aim * second.forward,
+        aim=first.aim + second.aim,
+        forward=first.forward + second.forward,
+    )
+
+
+# Same as get_final_position, but on opcode and quantity arrays. The commands are split into chunks, each chunk is reduced to a
+# CourseTransform in its own process, and the transforms are combined in order
+def get_final_position_parallel(
+    opcodes: np.ndarray,
+    quantities: np.ndarray,
+    enable_aim: bool = False,
+    processes: int = None,
+    chunk_size: int = 1 << 22,
+) -> int:
+    processes = processes or cpu_count() or 1
+    starts = range(0, len(opcodes), chunk_size)
+
+    if processes == 1 or len(starts) <= 1:
+        transforms = [
+            get_course_transform(
+                opcodes[start : start + chunk_size],
+                quantities[start : start + chunk_size],
+                enable_aim,
+            )
+            for start in starts
+        ]
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            transforms = list(
+                executor.map(
+                    get_course_transform,
+                    [opcodes[start : start + chunk_size] for start in starts],
+                    [quantities[start : start + chunk_size] for start in starts],
+                    [enable_aim] * len(starts),
+                )
+            )
+
+    total = CourseTransform(horizontal=0, depth=0, aim=0, forward=0)
+    for transform in transforms:
+        total = combine_transforms(total, transform)
+    return total.horizontal * total.depth
+
+
 def main():
     directions = get_input()
     print(
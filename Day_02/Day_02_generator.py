@@ -0,0 +1,28 @@
+from random import Random
+from sys import argv
+
+
+def generate_input(scale: int = 1, seed: int = 0) -> str:
+    """
+    Generates a list of commands. "down" is more common than "up", so that the submarine keeps a positive depth.
+
+    Args:
+        scale (int, optional): The size of the input compared to the puzzle input (1000 commands). Defaults to 1.
+        seed (int, optional): The seed for the random number generator. Defaults to 0.
+
+    Returns:
+        str: The contents of an input file
+    """
+    rng = Random(seed)
+    directions = rng.choices(["forward", "down", "up"], [4, 4, 2], k=1000 * scale)
+    return "".join(f"{direction} {rng.randint(1, 9)}\n" for direction in directions)
+
+
+def main():
+    # The scale can be given as the first argument (ex. "python Day_02_generator.py 100 > input.txt")
+    scale = int(argv[1]) if len(argv) > 1 else 1
+    print(generate_input(scale=scale), end="")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,6 @@
-from typing import Iterable, Tuple
+from bisect import bisect_left
+from typing import Callable, Iterable, Tuple
+import numpy as np
 
 
 def most_common_bit(nums: Iterable[int], position: int) -> int:
@@ -100,14 +102,200 @@ def find_o2_co2_product(diagnostics: Iterable[int], bin_len: int) -> int:
     return oxygen[0] * carbon_dioxide[0]
 
 
+def most_common_criteria(zeros: int, ones: int) -> int:
+    """
+    The bit criteria for the oxygen generator rating: the most common bit, or 1 if they are equally represented
+
+    Args:
+        zeros (int): The number of remaining diagnostics with a 0 in the current position
+        ones (int): The number of remaining diagnostics with a 1 in the current position
+
+    Returns:
+        int: The bit to keep
+    """
+    return 1 if ones >= zeros else 0
+
+
+def least_common_criteria(zeros: int, ones: int) -> int:
+    """
+    The bit criteria for the carbon dioxide scrubber rating: the least common bit, or 0 if they are equally represented
+
+    Args:
+        zeros (int): The number of remaining diagnostics with a 0 in the current position
+        ones (int): The number of remaining diagnostics with a 1 in the current position
+
+    Returns:
+        int: The bit to keep
+    """
+    return 1 if ones < zeros else 0
+
+
+class DiagnosticIndex:
+    """
+    A sorted index over the diagnostics, to find ratings without filtering any lists.
+    In the sorted list, all diagnostics that share their leading bits are next to each other, and the ones with a 0 in the next
+    position come before the ones with a 1. Every step of the bit criteria therefore narrows a range of the sorted list, and the
+    number of 0's and 1's in the range comes from a single binary search. The index is built once and can answer any number of
+    bit criteria.
+    """
+
+    def __init__(self, diagnostics: Iterable[int], bin_len: int):
+        self._diagnostics = sorted(diagnostics)
+        self._bin_len = bin_len
+
+    def count_bits(
+        self, start: int, end: int, prefix: int, position: int
+    ) -> Tuple[int, int]:
+        """
+        Counts the 0's and 1's at a bit position within a range of the index. All diagnostics in the range must share the bits
+        above the position, given by prefix
+
+        Args:
+            start (int): The start of the range in the sorted diagnostics
+            end (int): The end of the range (exclusive)
+            prefix (int): The bits shared by the range, with every bit at or below the position set to 0
+            position (int): The bit position, counted from 1 for the least significant bit
+
+        Returns:
+            Tuple[int, int]: The number of 0's and the number of 1's
+        """
+        split = bisect_left(
+            self._diagnostics, prefix | (0x1 << position - 1), start, end
+        )
+        return split - start, end - split
+
+    def find_rating(self, criteria: Callable[[int, int], int]) -> int:
+        """
+        Finds the rating for a bit criteria, by narrowing the range of the index one bit position at a time until one
+        diagnostic is left. If no diagnostic has the bit the criteria picks, the remaining diagnostics are kept, as they would
+        otherwise all be discarded
+
+        Args:
+            criteria (Callable[[int, int], int]): Given the number of 0's and 1's in the current position, returns the bit to keep
+
+        Returns:
+            int: The rating
+        """
+        if len(self._diagnostics) == 0:
+            raise ValueError("There are no diagnostics to find a rating from")
+
+        start = 0
+        end = len(self._diagnostics)
+        prefix = 0x0
+        position = self._bin_len
+        while end - start > 1 and position > 0:
+            zeros, ones = self.count_bits(start, end, prefix, position)
+            bit = criteria(zeros, ones)
+            if (bit == 1 and ones > 0) or zeros == 0:
+                start += zeros
+                prefix |= 0x1 << position - 1
+            else:
+                end -= ones
+            position -= 1
+
+        return self._diagnostics[start]
+
+
+def find_o2_co2_product_indexed(index: DiagnosticIndex) -> int:
+    """
+    Same as find_o2_co2_product, but finds both ratings from a DiagnosticIndex
+
+    Args:
+        index (DiagnosticIndex): The index over the diagnostics
+
+    Returns:
+        int: The product of oxygen and carbon dioxide rate, as per the specification in Advent of Code
+    """
+    return index.find_rating(most_common_criteria) * index.find_rating(
+        least_common_criteria
+    )
+
+
 # Converts the binary string into its equivalent integer, and returns the length of each binary array (length is constant in the output)
-def get_input() -> Tuple[Iterable[int], int]:
+def get_input(input_file: str = "Day_03_input.txt") -> Tuple[Iterable[int], int]:
     return (
-        [int(num, 2) for num in open("Day_03_input.txt").readlines()],
-        len(open("Day_03_input.txt").readlines()[0].strip()),
+        [int(num, 2) for num in open(input_file).readlines()],
+        len(open(input_file).readlines()[0].strip()),
     )
 
 
+def get_input_bit_matrix(input_file: str = "Day_03_input.txt") -> np.ndarray:
+    """
+    Reads the binary strings straight into a 2-D matrix of bits, without converting each line to an integer.
+    Every line has the same length, so the file's bytes can be reshaped into one row per line. The line endings are then dropped.
+    Because the bits are never packed into an integer, there is no limit on the length of the binary strings
+
+    Args:
+        input_file (str, optional): The path to the input file. Defaults to "Day_03_input.txt".
+
+    Returns:
+        np.ndarray: A (number of diagnostics, binary string length) uint8 matrix of 0's and 1's. Column 0 is the most significant bit
+    """
+    with open(input_file, "rb") as file:
+        data = file.read().rstrip()
+    if len(data) == 0:
+        return np.zeros((0, 0), dtype=np.uint8)
+
+    buffer = np.frombuffer(data, dtype=np.uint8)
+    first_line = data.split(b"\n", 1)[0]
+    bin_len = len(first_line.rstrip(b"\r"))
+    stride = len(first_line) + 1
+
+    # The last line has no line ending after rstrip(), so pad it to a full row
+    rows = -(-len(buffer) // stride)
+    padded = np.full(rows * stride, ord("\n"), dtype=np.uint8)
+    padded[: len(buffer)] = buffer
+    bits = padded.reshape(rows, stride)[:, :bin_len] - ord("0")
+
+    if bits.max(initial=0) > 1:
+        raise ValueError("Every line must be a binary string of the same length")
+    return bits
+
+
+def count_ones_per_column(bits: np.ndarray) -> np.ndarray:
+    """
+    Counts the number of 1's in every bit position with a single reduction over the bit matrix
+
+    Args:
+        bits (np.ndarray): The bit matrix returned by get_input_bit_matrix
+
+    Returns:
+        np.ndarray: The number of 1's in each column, with the most significant bit first
+    """
+    return bits.sum(axis=0, dtype=np.int64)
+
+
+def bits_to_int(bits: np.ndarray) -> int:
+    """
+    Converts a row of bits (most significant bit first) to an integer of any size
+
+    Args:
+        bits (np.ndarray): A 1-D array of 0's and 1's
+
+    Returns:
+        int: The integer the bits represent
+    """
+    if len(bits) == 0:
+        return 0
+    return int((np.asarray(bits, dtype=np.uint8) + ord("0")).tobytes(), 2)
+
+
+def find_gamma_epsilon_product_matrix(bits: np.ndarray) -> int:
+    """
+    Same as find_gamma_epsilon_product, but finds every column's most common bit from one count of the bit matrix.
+    As in most_common_bit, a position where 0's and 1's are equally represented is added to epsilon
+
+    Args:
+        bits (np.ndarray): The bit matrix returned by get_input_bit_matrix
+
+    Returns:
+        int: The product of gamma and epsilon as defined by Advent of Code
+    """
+    ones = count_ones_per_column(bits)
+    gamma_bits = ones > len(bits) - ones
+    return bits_to_int(gamma_bits) * bits_to_int(~gamma_bits)
+
+
 def main():
     diagnostics = get_input()
     print(
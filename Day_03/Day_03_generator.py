@@ -0,0 +1,33 @@
+from random import Random
+from sys import argv
+
+
+def generate_input(scale: int = 1, seed: int = 0) -> str:
+    """
+    Generates a list of binary diagnostic numbers. The numbers are unique, as the oxygen and carbon dioxide ratings can only be
+    found when a single number is left. The binary strings are therefore made longer than 12 bits when needed.
+
+    Args:
+        scale (int, optional): The size of the input compared to the puzzle input (1000 numbers). Defaults to 1.
+        seed (int, optional): The seed for the random number generator. Defaults to 0.
+
+    Returns:
+        str: The contents of an input file
+    """
+    rng = Random(seed)
+    count = 1000 * scale
+    bin_len = max(12, (count * 4).bit_length())
+    return "".join(
+        format(num, "0" + str(bin_len) + "b") + "\n"
+        for num in rng.sample(range(0, 2**bin_len), count)
+    )
+
+
+def main():
+    # The scale can be given as the first argument (ex. "python Day_03_generator.py 100 > input.txt")
+    scale = int(argv[1]) if len(argv) > 1 else 1
+    print(generate_input(scale=scale), end="")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,46 +1,50 @@
-from typing import Iterable, Tuple
+from collections import defaultdict
+from heapq import heappush, heappushpop
+from typing import Dict, Iterable, Iterator, List, TextIO, Tuple
 import re
-
-
-class BingoNum:
-    """
-    A class to represent a number on a bingo board, which includes the number and an indicator to determine if it
-    has been marked or not
-    """
-
-    def __init__(self, number: int):
-        self._num = number
-        self._marked = False
-
-    def get_num(self) -> int:
-        return self._num
-
-    def mark_num(self):
-        self._marked = True
-
-    def is_marked(self) -> bool:
-        return self._marked
-
-    def get_num(self) -> int:
-        return self._num
+import numpy as np
 
 
 class BingoBoard:
     """
-    A class to represent a bingo board. A bingo board is represented as a 2-D nested list of BingoNum instances
+    A class to represent a bingo board. The numbers are kept as a 2-D nested list of integers, and the marked numbers as a bitmask
+    with one bit per cell. An inverted index from each number to its cell, and a count of the marked cells in each row and column,
+    make marking a number and checking for a bingo constant time operations
     """
 
+    __slots__ = ("_rows", "_cells", "_row_hits", "_col_hits", "_marked")
+
     def __init__(self):
         self._rows = []
+        self._cells = {}
+        self._row_hits = []
+        self._col_hits = []
+        self._marked = 0x0
 
-    def add_row(self, row: Iterable[BingoNum]):
+    def add_row(self, row: Iterable[int]):
         """
-        Adds a list of BingoNum items, which represent a row
+        Adds a list of numbers, which represent a row
 
         Args:
-            row (Iterable[BingoNum]): A list of BingoNum items
+            row (Iterable[int]): A list of numbers
         """
+        row = list(row)
+        if len(self._col_hits) == 0:
+            self._col_hits = [0] * len(row)
+        for col, num in enumerate(row):
+            # If a number appears twice on a board, only its first cell is marked
+            self._cells.setdefault(num, (len(self._rows), col))
         self._rows.append(row)
+        self._row_hits.append(0)
+
+    def get_numbers(self) -> Iterable[int]:
+        """
+        Returns the numbers on the bingo board
+
+        Returns:
+            Iterable[int]: The distinct numbers on the board
+        """
+        return self._cells.keys()
 
     def mark_num_return_bingo(self, num: int) -> bool:
         """
@@ -53,10 +57,17 @@ class BingoBoard:
         Returns:
             bool: Whether a bingo was found (True) or not (False)
         """
-        for i in [i for i, x in enumerate(self._rows)]:
-            for j in [j for j, x in enumerate(self._rows[i]) if x._num == num]:
-                self._rows[i][j].mark_num()
-                return self.check_bingo(i, j)
+        cell = self._cells.get(num)
+        if cell is None:
+            return False
+
+        row_num, col_num = cell
+        bit = 0x1 << row_num * len(self._col_hits) + col_num
+        if not self._marked & bit:
+            self._marked |= bit
+            self._row_hits[row_num] += 1
+            self._col_hits[col_num] += 1
+        return self.check_bingo(row_num, col_num)
 
     def check_bingo(self, row_num: int, col_num: int) -> bool:
         """
@@ -69,18 +80,9 @@ class BingoBoard:
         Returns:
             bool: Whether a bingo was found (True) or not (False)
         """
-        bingo = True
-        for num in self._rows[row_num]:
-            bingo = bingo & num.is_marked()
-
-        if bingo == True:
-            return bingo
-
-        bingo = True
-        for row in self._rows:
-            bingo = bingo & row[col_num].is_marked()
-
-        return bingo
+        return self._row_hits[row_num] == len(self._col_hits) or self._col_hits[
+            col_num
+        ] == len(self._rows)
 
     def add_unmarked_numbers(self) -> int:
         """
@@ -91,25 +93,49 @@ class BingoBoard:
             int: The sum of all unmarked numbers
         """
         addition = 0
+        bit = 0x1
         for row in self._rows:
             for num in row:
-                if num.is_marked() == False:
-                    addition += num.get_num()
+                if not self._marked & bit:
+                    addition += num
+                bit <<= 1
         return addition
 
 
-def get_input() -> Tuple[Iterable[int], Iterable[BingoBoard]]:
+def build_draw_index(boards: Iterable[BingoBoard]) -> Dict[int, List[int]]:
+    """
+    Builds a global index from each number to the boards that contain it, so that a draw only visits those boards
+
+    Args:
+        boards (Iterable[BingoBoard]): The list of bingo boards
+
+    Returns:
+        Dict[int, List[int]]: Maps each number to the indices of the boards that contain it, in the order of the boards
+    """
+    draw_index = defaultdict(list)
+    for i, board in enumerate(boards):
+        for num in board.get_numbers():
+            draw_index[num].append(i)
+    return draw_index
+
+
+def get_input(
+    input_file: str = "Day_04_input.txt",
+) -> Tuple[Iterable[int], Iterable[BingoBoard]]:
     """
     Reads through the input file, extracts the draws and all bingo boards, and returns a list for draws and a
     list for bingo boards
 
+    Args:
+        input_file (str, optional): The path to the input file. Defaults to "Day_04_input.txt".
+
     Returns:
         List of Draws(Iterable[int]), List of BingoBoards(Iterable[BingoBoard]):
         Returns a Tuple containing a list of Draw Numbers, and a List of Bingo Boards
     """
     boards = []
 
-    with open("Day_04_input.txt") as file:
+    with open(input_file) as file:
         # The first line of the input file is the list of draw numbers. Handle that line first
         draws = [int(draw) for draw in re.findall("[0-9]+", file.readline())]
 
@@ -118,39 +144,347 @@ def get_input() -> Tuple[Iterable[int], Iterable[BingoBoard]]:
             if line == "\n":
                 boards.append(BingoBoard())
             else:
-                boards[-1].add_row(
-                    [BingoNum(int(num)) for num in re.findall("[0-9]+", line)]
-                )
+                boards[-1].add_row([int(num) for num in re.findall("[0-9]+", line)])
 
     return draws, boards
 
 
-def main():
-    draws, boards = get_input()
+def find_first_winning_score(draws: Iterable[int], boards: Iterable[BingoBoard]) -> int:
+    """
+    Plays the draws against the boards and returns the score of the first board to get a bingo. Answers Part 1.
+    Each draw only visits the boards that contain it, found through build_draw_index
 
-    # For Part 1, find the first winning board
+    Args:
+        draws (Iterable[int]): The list of draw numbers
+        boards (Iterable[BingoBoard]): The list of bingo boards, which are marked as the draws are played
+
+    Returns:
+        int: The sum of the unmarked numbers on the first winning board, multiplied by the winning draw
+    """
+    draw_index = build_draw_index(boards)
     winning_product = None
     for draw in draws:
         if winning_product != None:
             break
-        for board in boards:
+        for i in draw_index.get(draw, []):
+            board = boards[i]
             if board.mark_num_return_bingo(draw):
                 winning_product = board.add_unmarked_numbers() * draw
                 break
-    print("Answer to Part 1:", winning_product)
+    return winning_product
 
-    # For Part 2, find the last winning board
+
+def find_last_winning_score(draws: Iterable[int], boards: Iterable[BingoBoard]) -> int:
+    """
+    Plays the draws against the boards and returns the score of the last board to get a bingo. Answers Part 2.
+    Each draw only visits the boards that contain it, found through build_draw_index
+
+    Args:
+        draws (Iterable[int]): The list of draw numbers
+        boards (Iterable[BingoBoard]): The list of bingo boards, which are marked as the draws are played
+
+    Returns:
+        int: The sum of the unmarked numbers on the last winning board, multiplied by the winning draw
+    """
+    draw_index = build_draw_index(boards)
+    winning_product = None
     won_boards = set()
     for draw in draws:
         if len(won_boards) == len(boards):
             break
-        for board in boards:
+        for i in draw_index.get(draw, []):
+            board = boards[i]
             if board.mark_num_return_bingo(draw):
                 won_boards.add(board)
             if len(won_boards) == len(boards):
                 winning_product = board.add_unmarked_numbers() * draw
                 break
-    print("Answer to Part 2:", winning_product)
+    return winning_product
+
+
+def get_input_arrays(
+    input_file: str = "Day_04_input.txt",
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reads the draws and all bingo boards into arrays, without creating an object for each number
+
+    Args:
+        input_file (str, optional): The path to the input file. Defaults to "Day_04_input.txt".
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The draws as a 1-D array, and the boards as a (boards, 5, 5) array
+    """
+    with open(input_file) as file:
+        draws = np.array(re.findall("[0-9]+", file.readline()), dtype=np.int64)
+        boards = np.fromstring(file.read(), dtype=np.int64, sep=" ")
+    return draws, boards.reshape(-1, 5, 5)
+
+
+def get_cell_ranks(draws: np.ndarray, boards: np.ndarray) -> np.ndarray:
+    """
+    Replaces every number on the boards with its rank: the index of the draw that marks it.
+    Numbers that are never drawn get a rank of len(draws), which is later than any draw
+
+    Args:
+        draws (np.ndarray): The draws
+        boards (np.ndarray): The boards, as a (boards, 5, 5) array
+
+    Returns:
+        np.ndarray: A (boards, 5, 5) array of ranks
+    """
+    never = len(draws)
+    rank_of = np.full(
+        max(int(draws.max(initial=0)), int(boards.max(initial=0))) + 1,
+        never,
+        dtype=np.int64,
+    )
+
+    # A number drawn twice keeps the rank of its first draw
+    drawn, first_ranks = np.unique(draws, return_index=True)
+    rank_of[drawn] = first_ranks
+    return rank_of[boards]
+
+
+def get_winning_ranks(cell_ranks: np.ndarray) -> np.ndarray:
+    """
+    Finds the draw on which each board wins. A row (or column) is complete once its latest number is drawn, which is the maximum
+    rank along it. The board wins with its earliest complete row or column, which is the minimum of those maximums
+
+    Args:
+        cell_ranks (np.ndarray): The (boards, 5, 5) array returned by get_cell_ranks
+
+    Returns:
+        np.ndarray: The index of the winning draw of each board, or len(draws) if the board never wins
+    """
+    row_wins = cell_ranks.max(axis=2).min(axis=1)
+    col_wins = cell_ranks.max(axis=1).min(axis=1)
+    return np.minimum(row_wins, col_wins)
+
+
+def get_board_scores(
+    draws: np.ndarray, boards: np.ndarray, cell_ranks: np.ndarray, win_ranks: np.ndarray
+) -> np.ndarray:
+    """
+    Calculates the score of every board at the draw it wins on: the sum of its numbers that are not yet drawn, multiplied by the
+    winning draw. Boards that never win get a score of 0
+
+    Args:
+        draws (np.ndarray): The draws
+        boards (np.ndarray): The boards, as a (boards, 5, 5) array
+        cell_ranks (np.ndarray): The (boards, 5, 5) array returned by get_cell_ranks
+        win_ranks (np.ndarray): The winning draw of each board, returned by get_winning_ranks
+
+    Returns:
+        np.ndarray: The score of each board
+    """
+    won = win_ranks < len(draws)
+    unmarked = np.where(cell_ranks > win_ranks[:, None, None], boards, 0).sum(
+        axis=(1, 2)
+    )
+    winning_draws = draws[np.where(won, win_ranks, 0)] if len(draws) > 0 else 0
+    return np.where(won, unmarked * winning_draws, 0)
+
+
+def find_first_last_winning_scores(
+    draws: np.ndarray, boards: np.ndarray
+) -> Tuple[int, int]:
+    """
+    Finds the scores of the first and last winning boards together, with no board ever being played draw by draw.
+    Like find_first_winning_score and find_last_winning_score, boards that win on the same draw are taken in the order of the input,
+    and the last winner is None if some board never wins
+
+    Args:
+        draws (np.ndarray): The draws
+        boards (np.ndarray): The boards, as a (boards, 5, 5) array
+
+    Returns:
+        Tuple[int, int]: The score of the first winning board, and the score of the last winning board
+    """
+    if len(boards) == 0:
+        return None, None
+
+    cell_ranks = get_cell_ranks(draws, boards)
+    win_ranks = get_winning_ranks(cell_ranks)
+    scores = get_board_scores(draws, boards, cell_ranks, win_ranks)
+
+    # argmin and argmax return the first index among ties, so the last winner is searched for in reverse
+    first = int(np.argmin(win_ranks))
+    last = len(win_ranks) - 1 - int(np.argmax(win_ranks[::-1]))
+    first_score = int(scores[first]) if win_ranks[first] < len(draws) else None
+    last_score = int(scores[last]) if win_ranks[last] < len(draws) else None
+    return first_score, last_score
+
+
+def read_boards(file: TextIO) -> Iterator[List[List[int]]]:
+    """
+    Reads the bingo boards from an open input file one at a time, after the line of draws has been read.
+    Only the board being read is held in memory
+
+    Args:
+        file (TextIO): The open input file, positioned after the line of draws
+
+    Returns:
+        Iterator[List[List[int]]]: Yields each board as a list of rows
+    """
+    rows = []
+    for line in file:
+        nums = [int(num) for num in re.findall("[0-9]+", line)]
+        if len(nums) > 0:
+            rows.append(nums)
+        elif len(rows) > 0:
+            yield rows
+            rows = []
+    if len(rows) > 0:
+        yield rows
+
+
+def score_board(
+    rows: List[List[int]], draw_ranks: Dict[int, int], draws: List[int]
+) -> Tuple[int, int]:
+    """
+    Finds the draw on which a single board wins, and its score at that draw, from the rank of each number's draw.
+    This is the same calculation as get_winning_ranks and get_board_scores, for one board at a time
+
+    Args:
+        rows (List[List[int]]): The board, as a list of rows
+        draw_ranks (Dict[int, int]): Maps each drawn number to the index of its first draw
+        draws (List[int]): The draws
+
+    Returns:
+        Tuple[int, int]: The index of the winning draw and the score, or (len(draws), 0) if the board never wins
+    """
+    never = len(draws)
+    ranks = [[draw_ranks.get(num, never) for num in row] for row in rows]
+    win_rank = min(min(max(row) for row in ranks), min(max(col) for col in zip(*ranks)))
+    if win_rank == never:
+        return never, 0
+
+    unmarked = 0
+    for row, row_ranks in zip(rows, ranks):
+        for num, rank in zip(row, row_ranks):
+            if rank > win_rank:
+                unmarked += num
+    return win_rank, unmarked * draws[win_rank]
+
+
+class BingoTournament:
+    """
+    A class to keep track of the winners of a tournament as boards arrive one at a time, without keeping the boards.
+    Winners are ordered by their winning draw, and boards that win on the same draw are ordered by when they arrived, as in
+    find_first_winning_score and find_last_winning_score. Boards that never win are not counted as winners.
+    Positions count from 1 for the first winner, and from -1 for the last winner. For each direction, only as many winners as the
+    furthest position requested are kept, in a heap
+    """
+
+    def __init__(self, draws: List[int], positions: Iterable[int] = (1, -1)):
+        self._draws = draws
+        self._draw_ranks = {}
+        for rank, draw in enumerate(draws):
+            self._draw_ranks.setdefault(draw, rank)
+
+        positions = list(positions)
+        if 0 in positions:
+            raise ValueError(
+                "Positions count from 1 (first winner) or -1 (last winner)"
+            )
+        self._positions = positions
+        self._first_count = max(
+            [position for position in positions if position > 0], default=0
+        )
+        self._last_count = max(
+            [-position for position in positions if position < 0], default=0
+        )
+
+        # The earliest winners are kept in a max-heap (with negated keys) and the latest winners in a min-heap
+        self._earliest = []
+        self._latest = []
+        self._boards = 0
+        self._winners = 0
+
+    def add_board(self, rows: List[List[int]]):
+        """
+        Scores a board and keeps it if it is among the winners at any requested position
+
+        Args:
+            rows (List[List[int]]): The board, as a list of rows
+        """
+        win_rank, score = score_board(rows, self._draw_ranks, self._draws)
+        order = self._boards
+        self._boards += 1
+        if win_rank == len(self._draws):
+            return
+        self._winners += 1
+
+        if self._first_count > 0:
+            entry = (-win_rank, -order, score)
+            if len(self._earliest) < self._first_count:
+                heappush(self._earliest, entry)
+            else:
+                heappushpop(self._earliest, entry)
+        if self._last_count > 0:
+            entry = (win_rank, order, score)
+            if len(self._latest) < self._last_count:
+                heappush(self._latest, entry)
+            else:
+                heappushpop(self._latest, entry)
+
+    def get_winner_score(self, position: int) -> int:
+        """
+        Returns the score of the winner at a position requested when the tournament was created
+
+        Args:
+            position (int): The position of the winner (1 for the first winner, -1 for the last winner, 2 for the second...)
+
+        Returns:
+            int: The score of the winner, or None if fewer boards than that have won
+        """
+        if position not in self._positions:
+            raise ValueError(
+                f"Position {position} was not requested for this tournament"
+            )
+        if abs(position) > self._winners:
+            return None
+        if position > 0:
+            winners = sorted(self._earliest, reverse=True)
+            return winners[position - 1][2]
+        winners = sorted(self._latest, reverse=True)
+        return winners[-position - 1][2]
+
+    def get_board_count(self) -> int:
+        return self._boards
+
+
+def play_tournament(
+    input_file: str = "Day_04_input.txt", positions: Iterable[int] = (1, -1)
+) -> Dict[int, int]:
+    """
+    Streams the boards from an input file through a BingoTournament and returns the winning score at each requested position,
+    in one pass over the file. The default positions answer Part 1 and Part 2
+
+    Args:
+        input_file (str, optional): The path to the input file. Defaults to "Day_04_input.txt".
+        positions (Iterable[int], optional): The positions of the winners to score. Defaults to (1, -1).
+
+    Returns:
+        Dict[int, int]: Maps each position to the score of its winner
+    """
+    positions = list(positions)
+    with open(input_file) as file:
+        draws = [int(draw) for draw in re.findall("[0-9]+", file.readline())]
+        tournament = BingoTournament(draws=draws, positions=positions)
+        for rows in read_boards(file):
+            tournament.add_board(rows)
+    return {position: tournament.get_winner_score(position) for position in positions}
+
+
+def main():
+    draws, boards = get_input()
+
+    # For Part 1, find the first winning board
+    print("Answer to Part 1:", find_first_winning_score(draws=draws, boards=boards))
+
+    # For Part 2, find the last winning board
+    print("Answer to Part 2:", find_last_winning_score(draws=draws, boards=boards))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,38 @@
+from random import Random
+from sys import argv
+
+
+def generate_input(scale: int = 1, seed: int = 0) -> str:
+    """
+    Generates the draws and the bingo boards. Like the puzzle input, every number from 0 to 99 is drawn once, and every board
+    holds 25 different numbers from the same range.
+
+    Args:
+        scale (int, optional): The size of the input compared to the puzzle input (100 boards). Defaults to 1.
+        seed (int, optional): The seed for the random number generator. Defaults to 0.
+
+    Returns:
+        str: The contents of an input file
+    """
+    rng = Random(seed)
+    draws = list(range(0, 100))
+    rng.shuffle(draws)
+    lines = [",".join(str(draw) for draw in draws) + "\n"]
+    for board in range(0, 100 * scale):
+        nums = rng.sample(draws, 25)
+        lines.append("\n")
+        for row in range(0, 5):
+            lines.append(
+                " ".join(f"{num:>2}" for num in nums[row * 5 : row * 5 + 5]) + "\n"
+            )
+    return "".join(lines)
+
+
+def main():
+    # The scale can be given as the first argument (ex. "python Day_04_generator.py 100 > input.txt")
+    scale = int(argv[1]) if len(argv) > 1 else 1
+    print(generate_input(scale=scale), end="")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,11 @@
-from typing import Tuple, List
+from bisect import bisect_left, bisect_right, insort
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from os import cpu_count
+from typing import Dict, Iterator, Tuple, List
 from re import findall
+import numpy as np
 
 
 class CoorPair:
@@ -55,15 +61,18 @@ class CoorPair:
                 self.y2 = y1
 
 
-def get_input() -> List[CoorPair]:
+def get_input(input_file: str = "Day_05_input.txt") -> List[CoorPair]:
     """
     Reads the input file and returns all coordinate pairs as a list of CoorPair instances
 
+    Args:
+        input_file (str, optional): The path to the input file. Defaults to "Day_05_input.txt".
+
     Returns:
         List[CoorPair]: List of coordinate pairs
     """
     coor_pairs = []
-    with open("Day_05_input.txt") as file:
+    with open(input_file) as file:
         for line in file.readlines():
             coors = findall("[0-9]+", line)
             coor_pairs.append(
@@ -150,6 +159,621 @@ def count_overlapping_coordinates(
     return len(overlapping_coordinates)
 
 
+def get_input_array(input_file: str = "Day_05_input.txt") -> np.ndarray:
+    """
+    Reads the input file straight into an array of segments, without creating a CoorPair for each line
+
+    Args:
+        input_file (str, optional): The path to the input file. Defaults to "Day_05_input.txt".
+
+    Returns:
+        np.ndarray: An (n, 4) integer array, with one (x1, y1, x2, y2) row for each line
+    """
+    with open(input_file) as file:
+        coors = np.array(findall("[0-9]+", file.read()), dtype=np.int64)
+    return coors.reshape(-1, 4)
+
+
+def pairs_to_array(pairs: List[CoorPair]) -> np.ndarray:
+    """
+    Converts a list of CoorPair instances into an array of segments
+
+    Args:
+        pairs (List[CoorPair]): The list of coordinate pairs
+
+    Returns:
+        np.ndarray: An (n, 4) integer array, with one (x1, y1, x2, y2) row for each pair
+    """
+    return np.array(
+        [(pair.x1, pair.y1, pair.x2, pair.y2) for pair in pairs], dtype=np.int64
+    ).reshape(-1, 4)
+
+
+def rasterize_segments(segments: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Generates every point on every segment at once. Each segment steps by -1, 0 or 1 in each direction, so the points of a segment
+    are its start plus (step * offset) for each offset along its length
+
+    Args:
+        segments (np.ndarray): An (n, 4) array of (x1, y1, x2, y2) rows. Every segment must be horizontal, vertical or diagonal
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The x and y coordinates of all points
+    """
+    x1, y1, x2, y2 = segments.T
+    lengths = np.maximum(np.abs(x2 - x1), np.abs(y2 - y1)) + 1
+    segment_ids = np.repeat(np.arange(len(segments)), lengths)
+    offsets = np.arange(lengths.sum()) - np.repeat(
+        np.cumsum(lengths) - lengths, lengths
+    )
+    xs = x1[segment_ids] + np.sign(x2 - x1)[segment_ids] * offsets
+    ys = y1[segment_ids] + np.sign(y2 - y1)[segment_ids] * offsets
+    return xs, ys
+
+
+def count_overlapping_coordinates_grid(
+    segments: np.ndarray,
+    include_diagonals: bool,
+    max_grid_cells: int = 1 << 24,
+    max_batch_points: int = 1 << 24,
+) -> int:
+    """
+    Same as count_overlapping_coordinates, but rasterizes each segment once into a counter grid instead of comparing every pair.
+    The points are counted into a dense grid with bincount, in batches of segments so that only about max_batch_points points are
+    held at a time (a single segment can be longer, but never longer than a side of the grid). If the coordinates span more than
+    max_grid_cells cells, the dense grid would be too large, so the points are counted sparsely instead. The map is then split into
+    regions of at most max_batch_points points each (see clip_segments), and the points of each region are counted with np.unique
+
+    Args:
+        segments (np.ndarray): An (n, 4) array of (x1, y1, x2, y2) rows, from get_input_array or pairs_to_array
+        include_diagonals (bool): Indicates whether diagonal segments should be included
+        max_grid_cells (int, optional): The largest dense grid to use. Defaults to 1 << 24.
+        max_batch_points (int, optional): The number of points to rasterize at a time. Defaults to 1 << 24.
+
+    Returns:
+        int: The number of coordinates covered by at least two segments
+    """
+    segments = np.asarray(segments, dtype=np.int64).reshape(-1, 4)
+    if not include_diagonals:
+        segments = segments[
+            (segments[:, 0] == segments[:, 2]) | (segments[:, 1] == segments[:, 3])
+        ]
+    if len(segments) == 0:
+        return 0
+
+    # Shift the coordinates so that the grid starts at (0, 0)
+    min_x = min(segments[:, 0].min(), segments[:, 2].min())
+    min_y = min(segments[:, 1].min(), segments[:, 3].min())
+    width = int(max(segments[:, 0].max(), segments[:, 2].max()) - min_x + 1)
+    height = int(max(segments[:, 1].max(), segments[:, 3].max()) - min_y + 1)
+    segments = segments - np.array([min_x, min_y, min_x, min_y])
+
+    if width * height <= max_grid_cells:
+        # Split the segments into batches of about max_batch_points points
+        lengths = (
+            np.maximum(
+                np.abs(segments[:, 2] - segments[:, 0]),
+                np.abs(segments[:, 3] - segments[:, 1]),
+            )
+            + 1
+        )
+        batch_ids = np.cumsum(lengths) // max_batch_points
+        bounds = np.flatnonzero(np.diff(batch_ids)) + 1
+        batches = np.split(segments, bounds)
+
+        coverage = np.zeros(width * height, dtype=np.int32)
+        for batch in batches:
+            xs, ys = rasterize_segments(batch)
+            coverage += np.bincount(ys * width + xs, minlength=width * height).astype(
+                np.int32
+            )
+        return int(np.count_nonzero(coverage >= 2))
+
+    # Split the map into regions that each hold at most max_batch_points points, halving the longer side of a region that holds
+    # more. A single cell is never split further, and holds at most one point per segment
+    overlapping = 0
+    regions = [(segments, 0, 0, width - 1, height - 1)]
+    while regions:
+        region_segments, x_min, y_min, x_max, y_max = regions.pop()
+        region_segments = clip_segments(region_segments, x_min, y_min, x_max, y_max)
+        points = int(
+            np.maximum(
+                np.abs(region_segments[:, 2] - region_segments[:, 0]),
+                np.abs(region_segments[:, 3] - region_segments[:, 1]),
+            ).sum()
+            + len(region_segments)
+        )
+        if points < 2:
+            continue
+
+        if points > max_batch_points and (x_min < x_max or y_min < y_max):
+            if x_max - x_min >= y_max - y_min:
+                middle = (x_min + x_max) // 2
+                regions.append((region_segments, x_min, y_min, middle, y_max))
+                regions.append((region_segments, middle + 1, y_min, x_max, y_max))
+            else:
+                middle = (y_min + y_max) // 2
+                regions.append((region_segments, x_min, y_min, x_max, middle))
+                regions.append((region_segments, x_min, middle + 1, x_max, y_max))
+            continue
+
+        xs, ys = rasterize_segments(region_segments)
+        values, counts = np.unique(ys * width + xs, return_counts=True)
+        overlapping += int(np.count_nonzero(counts >= 2))
+
+    return overlapping
+
+
+# The four orientations of a line. For each orientation, the point (x, y) lies on the line given by key(x, y), at the position
+# param(x, y) along that line. point(key, param) turns a key and a position back into the point
+LINE_ORIENTATIONS = {
+    "horizontal": (lambda x, y: y, lambda x, y: x, lambda key, t: (t, key)),
+    "vertical": (lambda x, y: x, lambda x, y: y, lambda key, t: (key, t)),
+    "positive": (lambda x, y: x - y, lambda x, y: x, lambda key, t: (t, t - key)),
+    "negative": (lambda x, y: x + y, lambda x, y: x, lambda key, t: (t, key - t)),
+}
+
+
+def get_orientation(pair: CoorPair) -> str:
+    """
+    Helper function to return the orientation of a coordinate pair, as used in LINE_ORIENTATIONS
+
+    Args:
+        pair (CoorPair): The coordinate pair
+
+    Returns:
+        str: The orientation of the line
+    """
+    if pair.horizontal:
+        return "horizontal"
+    if pair.vertical:
+        return "vertical"
+    return "positive" if pair.y1 < pair.y2 else "negative"
+
+
+def merge_intervals(
+    intervals: List[Tuple[int, int]],
+) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]:
+    """
+    Sweeps through the intervals covered by the segments of a single line, and merges them into the parts of the line covered at
+    least once and the parts covered at least twice
+
+    Args:
+        intervals (List[Tuple[int, int]]): The (start, end) positions of each segment on the line, both inclusive
+
+    Returns:
+        Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]: The sorted, disjoint intervals covered at least once, and the sorted,
+        disjoint intervals covered at least twice
+    """
+    events = defaultdict(int)
+    for start, end in intervals:
+        events[start] += 1
+        events[end + 1] -= 1
+
+    covered = []
+    overlaps = []
+    coverage = 0
+    for position in sorted(events.keys()):
+        previous = coverage
+        coverage += events[position]
+        if previous < 1 <= coverage:
+            covered.append([position, None])
+        elif coverage < 1 <= previous:
+            covered[-1][1] = position - 1
+        if previous < 2 <= coverage:
+            overlaps.append([position, None])
+        elif coverage < 2 <= previous:
+            overlaps[-1][1] = position - 1
+
+    return [tuple(i) for i in covered], [tuple(i) for i in overlaps]
+
+
+def intervals_contain(intervals: List[Tuple[int, int]], position: int) -> bool:
+    """
+    Helper function to check if a position falls within a sorted list of disjoint intervals
+
+    Args:
+        intervals (List[Tuple[int, int]]): The sorted, disjoint (start, end) intervals, both inclusive
+        position (int): The position to look for
+
+    Returns:
+        bool: Whether the position is within one of the intervals
+    """
+    i = bisect_right(intervals, (position, float("inf"))) - 1
+    return i >= 0 and intervals[i][1] >= position
+
+
+def find_crossings(
+    first: str,
+    first_lines: Dict[int, Tuple[list, list]],
+    second: str,
+    second_lines: Dict[int, Tuple[list, list]],
+) -> Iterator[Tuple[int, int]]:
+    """
+    Finds the points where a covered interval of a line of one orientation crosses a covered interval of a line of another.
+    Along a line of the first orientation, the key of the second orientation changes by a fixed step, so each covered interval of
+    the first orientation spans a range of second keys. The sweep visits the lines of the second orientation in order of their keys,
+    keeping the first intervals whose range spans the current key active, sorted by the key of their line.
+    On a line of the second orientation, the position of the crossing with a first line is linear in the key of that first line,
+    so each covered interval of the second line only has to look at the active first lines in a range of keys. The cost is
+    therefore O((n + k) log n) for n intervals and k crossings, however long the segments are
+
+    Args:
+        first (str): The orientation of the first lines, as used in LINE_ORIENTATIONS
+        first_lines (Dict[int, Tuple[list, list]]): Maps the key of each first line to its merged intervals (see merge_intervals)
+        second (str): The orientation of the second lines, which must differ from the first
+        second_lines (Dict[int, Tuple[list, list]]): Maps the key of each second line to its merged intervals
+
+    Yields:
+        Iterator[Tuple[int, int]]: The (x, y) of each crossing point
+    """
+    first_key, first_param, first_point = LINE_ORIENTATIONS[first]
+    second_key, second_param, second_point = LINE_ORIENTATIONS[second]
+
+    # The keys and positions are linear in x and y, so their coefficients can be read off at (1, 0) and (0, 1)
+    a1, b1 = first_key(1, 0), first_key(0, 1)
+    a2, b2 = second_key(1, 0), second_key(0, 1)
+    c2, d2 = second_param(1, 0), second_param(0, 1)
+    determinant = a1 * b2 - a2 * b1
+
+    # The position on the second line (times the determinant) where it crosses the first line with key k1 is
+    # k1 * per_first + key * per_second
+    per_first = c2 * b2 - d2 * a2
+    per_second = d2 * a1 - c2 * b1
+
+    # Each covered interval of a first line, as (lowest second key, highest second key, first key, start, second key at start, step)
+    spans = []
+    for line, (covered, overlaps) in first_lines.items():
+        for start, end in covered:
+            start_key = second_key(*first_point(line, start))
+            step = second_key(*first_point(line, start + 1)) - start_key
+            end_key = start_key + step * (end - start)
+            spans.append(
+                (
+                    min(start_key, end_key),
+                    max(start_key, end_key),
+                    line,
+                    start,
+                    start_key,
+                    step,
+                )
+            )
+    spans.sort()
+    removals = sorted((span[1], index) for index, span in enumerate(spans))
+
+    # A first line crosses each second line at most once, so at most one interval of each first line is active at a time
+    active_lines = []
+    active_spans = {}
+    added = 0
+    removed = 0
+    for key in sorted(second_lines.keys()):
+        while removed < len(removals) and removals[removed][0] < key:
+            span = spans[removals[removed][1]]
+            if active_spans.get(span[2]) is span:
+                del active_lines[bisect_left(active_lines, span[2])]
+                del active_spans[span[2]]
+            removed += 1
+        while added < len(spans) and spans[added][0] <= key:
+            # Spans that ended before this key are skipped
+            if spans[added][1] >= key:
+                insort(active_lines, spans[added][2])
+                active_spans[spans[added][2]] = spans[added]
+            added += 1
+        if not active_lines:
+            continue
+
+        for low_position, high_position in second_lines[key][0]:
+            # The range of first keys whose crossing falls within this interval. The bounds are rounded outwards, which only adds
+            # candidates that are checked exactly below
+            bounds = [
+                position * determinant - key * per_second
+                for position in (low_position, high_position)
+            ]
+            low = bisect_left(active_lines, min(bound // per_first for bound in bounds))
+            high = bisect_right(
+                active_lines, max(-(-bound // per_first) for bound in bounds)
+            )
+            for line in active_lines[low:high]:
+                lowest, highest, line, start, start_key, step = active_spans[line]
+                if (key - start_key) % step != 0:
+                    continue
+                x, y = first_point(line, start + (key - start_key) // step)
+                if low_position <= second_param(x, y) <= high_position:
+                    yield x, y
+
+
+def count_overlapping_coordinates_sweep(
+    pairs: List[CoorPair], include_diagonals: bool
+) -> int:
+    """
+    Same as count_overlapping_coordinates, but without generating the points of any segment, so the cost depends on the number of
+    segments rather than their lengths. This handles coordinates in the millions.
+
+    The segments are bucketed by orientation and by the line they lie on. A point is covered at least twice when either two
+    segments on the same line cover it, or segments on two different lines cross at it:
+        1. Each line's segments are merged into the intervals covered at least once and at least twice. The points covered twice by a
+           single line are counted from the lengths of those intervals
+        2. Lines of different orientations cross at most once. The crossing points that both lines cover are found with a sweep
+           (see find_crossings) and kept in a set
+        3. A point counted in step 1 for two orientations is also a crossing point, so the total is the number of crossing points,
+           plus the points from step 1 that are not crossing points
+
+    Args:
+        pairs (List[CoorPair]): The list of coordinate pairs, represented by a list of CoorPair class instances
+        include_diagonals (bool): Indicates whether diagonal pairs should be included
+
+    Returns:
+        int: The number of overlapping coordinates
+    """
+    # Bucket the segments by orientation and by line, as intervals of positions along the line
+    lines = {orientation: defaultdict(list) for orientation in LINE_ORIENTATIONS}
+    for pair in pairs:
+        if pair.diagonal and not include_diagonals:
+            continue
+        orientation = get_orientation(pair)
+        key, param = LINE_ORIENTATIONS[orientation][:2]
+        ends = sorted([param(pair.x1, pair.y1), param(pair.x2, pair.y2)])
+        lines[orientation][key(pair.x1, pair.y1)].append(tuple(ends))
+
+    merged: Dict[str, Dict[int, Tuple[list, list]]] = {
+        orientation: {
+            line: merge_intervals(intervals)
+            for line, intervals in orientation_lines.items()
+        }
+        for orientation, orientation_lines in lines.items()
+    }
+
+    # Find the crossing points between each pair of orientations
+    crossings = set()
+    orientations = list(LINE_ORIENTATIONS.keys())
+    for i, first in enumerate(orientations):
+        for second in orientations[i + 1 :]:
+            crossings.update(
+                find_crossings(first, merged[first], second, merged[second])
+            )
+
+    # Add the points covered twice by a single line that are not already crossing points
+    overlapping = len(crossings)
+    for orientation, (key, param, point) in LINE_ORIENTATIONS.items():
+        for covered, overlaps in merged[orientation].values():
+            overlapping += sum(end - start + 1 for start, end in overlaps)
+        for x, y in crossings:
+            line = merged[orientation].get(key(x, y))
+            if line is not None and intervals_contain(line[1], param(x, y)):
+                overlapping -= 1
+
+    return overlapping
+
+
+def clip_segments(
+    segments: np.ndarray, x_min: int, y_min: int, x_max: int, y_max: int
+) -> np.ndarray:
+    """
+    Clips every segment to a rectangle, keeping only the part of each segment inside it. A segment's points are its start plus
+    (step * t) for t from 0 to its length, so each side of the rectangle limits the range of t.
+    The edges can also be arrays with one value per segment, to clip each segment to its own rectangle
+
+    Args:
+        segments (np.ndarray): An (n, 4) array of (x1, y1, x2, y2) rows
+        x_min (int): The left edge of the rectangle (inclusive)
+        y_min (int): The top edge of the rectangle (inclusive)
+        x_max (int): The right edge of the rectangle (inclusive)
+        y_max (int): The bottom edge of the rectangle (inclusive)
+
+    Returns:
+        np.ndarray: The clipped segments that still have at least one point inside the rectangle
+    """
+    x1, y1, x2, y2 = segments.T
+    x_step = np.sign(x2 - x1)
+    y_step = np.sign(y2 - y1)
+    low = np.zeros(len(segments), dtype=np.int64)
+    high = np.maximum(np.abs(x2 - x1), np.abs(y2 - y1))
+
+    for start, step, edge_min, edge_max in (
+        (x1, x_step, x_min, x_max),
+        (y1, y_step, y_min, y_max),
+    ):
+        # A segment that does not move in this direction is either always or never inside the edges
+        outside = (step == 0) & ((start < edge_min) | (start > edge_max))
+        high = np.where(outside, -1, high)
+        low = np.where(step > 0, np.maximum(low, edge_min - start), low)
+        high = np.where(step > 0, np.minimum(high, edge_max - start), high)
+        low = np.where(step < 0, np.maximum(low, start - edge_max), low)
+        high = np.where(step < 0, np.minimum(high, start - edge_min), high)
+
+    keep = low <= high
+    return np.stack(
+        [
+            (x1 + x_step * low)[keep],
+            (y1 + y_step * low)[keep],
+            (x1 + x_step * high)[keep],
+            (y1 + y_step * high)[keep],
+        ],
+        axis=1,
+    )
+
+
+def get_tile_pieces(
+    segments: np.ndarray, tile_size: int, height: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Clips every segment to each tile that it crosses, and only to those tiles.
+    Each segment is first split into the columns of tiles that it spans. Within a column, the segment moves steadily in y, so it
+    crosses every row of tiles between the rows of its two ends. The pieces are therefore found exactly, with two rounds of
+    np.repeat, instead of by clipping every segment to every tile
+
+    Args:
+        segments (np.ndarray): An (n, 4) array of (x1, y1, x2, y2) rows, with coordinates starting from 0
+        tile_size (int): The width and height of each tile
+        height (int): The height of the map
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: An (m, 4) array of the pieces, and the tile column and tile row of each piece
+    """
+
+    def expand(counts: np.ndarray, firsts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        # Repeats each index counts times, along with first, first + 1, ..., first + count - 1
+        indices = np.repeat(np.arange(len(counts)), counts)
+        offsets = np.arange(len(indices)) - np.repeat(
+            np.cumsum(counts) - counts, counts
+        )
+        return indices, firsts[indices] + offsets
+
+    x1, y1, x2, y2 = segments.T
+    first_columns = np.minimum(x1, x2) // tile_size
+    last_columns = np.maximum(x1, x2) // tile_size
+    indices, columns = expand(last_columns - first_columns + 1, first_columns)
+    strips = clip_segments(
+        segments[indices],
+        columns * tile_size,
+        0,
+        columns * tile_size + tile_size - 1,
+        height - 1,
+    )
+
+    first_rows = np.minimum(strips[:, 1], strips[:, 3]) // tile_size
+    last_rows = np.maximum(strips[:, 1], strips[:, 3]) // tile_size
+    indices, rows = expand(last_rows - first_rows + 1, first_rows)
+    columns = columns[indices]
+    pieces = clip_segments(
+        strips[indices],
+        columns * tile_size,
+        rows * tile_size,
+        columns * tile_size + tile_size - 1,
+        rows * tile_size + tile_size - 1,
+    )
+    return pieces, columns, rows
+
+
+def count_tile_overlaps(
+    pieces_name: str,
+    piece_count: int,
+    offset: int,
+    count: int,
+    tile: Tuple[int, int, int, int],
+) -> int:
+    """
+    Counts the overlapping coordinates within a single tile. Runs in a worker process.
+    The pieces of all of the tiles live in one array in shared memory, sorted by tile, so the worker only reads its own pieces and
+    nothing is copied to it. The coverage is counted in a grid the size of the tile
+
+    Args:
+        pieces_name (str): The name of the shared memory block holding the (piece_count, 4) array of pieces
+        piece_count (int): The total number of pieces
+        offset (int): The index of the first piece of this tile
+        count (int): The number of pieces in this tile
+        tile (Tuple[int, int, int, int]): The (x_min, y_min, x_max, y_max) edges of the tile, all inclusive
+
+    Returns:
+        int: The number of coordinates in the tile covered by at least two segments
+    """
+    pieces_memory = SharedMemory(name=pieces_name)
+    try:
+        pieces = np.ndarray((piece_count, 4), dtype=np.int64, buffer=pieces_memory.buf)
+        xs, ys = rasterize_segments(pieces[offset : offset + count])
+
+        # The arrays must be released before the shared memory can be closed
+        del pieces
+
+        x_min, y_min, x_max, y_max = tile
+        tile_width = x_max - x_min + 1
+        coverage = np.bincount(
+            (ys - y_min) * tile_width + (xs - x_min),
+            minlength=tile_width * (y_max - y_min + 1),
+        )
+        return int(np.count_nonzero(coverage >= 2))
+    finally:
+        pieces_memory.close()
+
+
+def count_overlapping_coordinates_tiled(
+    segments: np.ndarray,
+    include_diagonals: bool,
+    tile_size: int = 256,
+    processes: int = None,
+) -> int:
+    """
+    Same as count_overlapping_coordinates, but splits the map into square tiles and counts each tile in its own process.
+    Every segment is clipped to each tile it crosses (see get_tile_pieces), and the pieces are sorted by tile into one array in
+    shared memory. Each worker counts one tile from its own pieces, and the sum of the overlapping coordinates in each tile is the
+    total. Only a tile's worth of coverage is held at a time in each worker, however large the map is
+
+    Args:
+        segments (np.ndarray): An (n, 4) array of (x1, y1, x2, y2) rows, from get_input_array or pairs_to_array
+        include_diagonals (bool): Indicates whether diagonal segments should be included
+        tile_size (int, optional): The width and height of each tile. Defaults to 256.
+        processes (int, optional): The number of worker processes. Defaults to the number of CPUs.
+
+    Returns:
+        int: The number of coordinates covered by at least two segments
+    """
+    segments = np.asarray(segments, dtype=np.int64).reshape(-1, 4)
+    if not include_diagonals:
+        segments = segments[
+            (segments[:, 0] == segments[:, 2]) | (segments[:, 1] == segments[:, 3])
+        ]
+    if len(segments) == 0:
+        return 0
+
+    # Shift the coordinates so that the grid starts at (0, 0)
+    min_x = min(segments[:, 0].min(), segments[:, 2].min())
+    min_y = min(segments[:, 1].min(), segments[:, 3].min())
+    segments = segments - np.array([min_x, min_y, min_x, min_y])
+    width = int(max(segments[:, 0].max(), segments[:, 2].max()) + 1)
+    height = int(max(segments[:, 1].max(), segments[:, 3].max()) + 1)
+
+    # Sort the pieces by tile. A tile with fewer than two pieces has no overlaps, so it is skipped
+    pieces, columns, rows = get_tile_pieces(segments, tile_size, height)
+    tile_ids = rows * ((width + tile_size - 1) // tile_size) + columns
+    order = np.argsort(tile_ids, kind="stable")
+    pieces = pieces[order]
+    tile_ids, offsets, counts = np.unique(
+        tile_ids[order], return_index=True, return_counts=True
+    )
+    busy = counts >= 2
+    tasks = [
+        (
+            offset,
+            count,
+            (
+                column * tile_size,
+                row * tile_size,
+                min(column * tile_size + tile_size, width) - 1,
+                min(row * tile_size + tile_size, height) - 1,
+            ),
+        )
+        for offset, count, column, row in zip(
+            offsets[busy].tolist(),
+            counts[busy].tolist(),
+            columns[order][offsets[busy]].tolist(),
+            rows[order][offsets[busy]].tolist(),
+        )
+    ]
+    if not tasks:
+        return 0
+
+    processes = processes or cpu_count() or 1
+    pieces_memory = SharedMemory(create=True, size=pieces.nbytes)
+    try:
+        np.ndarray(pieces.shape, dtype=np.int64, buffer=pieces_memory.buf)[:] = pieces
+
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            counts = executor.map(
+                count_tile_overlaps,
+                [pieces_memory.name] * len(tasks),
+                [len(pieces)] * len(tasks),
+                [offset for offset, count, tile in tasks],
+                [count for offset, count, tile in tasks],
+                [tile for offset, count, tile in tasks],
+                # Send the tiles in chunks, as a single tile is often quicker to count than to send
+                chunksize=max(1, len(tasks) // (processes * 4)),
+            )
+            return sum(counts)
+    finally:
+        pieces_memory.close()
+        pieces_memory.unlink()
+
+
 def main():
     pairs = get_input()
     print(
@@ -0,0 +1,51 @@
+from random import Random
+from sys import argv
+
+
+def generate_input(scale: int = 1, seed: int = 0) -> str:
+    """
+    Generates lines of vents on a 1000 x 1000 map. A third of the lines are horizontal, a third are vertical, and a third are
+    diagonal at exactly 45 degrees.
+
+    Args:
+        scale (int, optional): The size of the input compared to the puzzle input (500 lines). Defaults to 1.
+        seed (int, optional): The seed for the random number generator. Defaults to 0.
+
+    Returns:
+        str: The contents of an input file
+    """
+    rng = Random(seed)
+    size = 1000
+    lines = []
+    for i in range(0, 500 * scale):
+        x1 = rng.randrange(0, size)
+        y1 = rng.randrange(0, size)
+        orientation = rng.randrange(0, 3)
+
+        # Horizontal and vertical lines end on any other point in the same row or column
+        if orientation == 0:
+            x2, y2 = (x1 + rng.randrange(1, size)) % size, y1
+        elif orientation == 1:
+            x2, y2 = x1, (y1 + rng.randrange(1, size)) % size
+
+        # Diagonal lines head towards the middle of the map, so there is always room for at least one step
+        else:
+            x_step = 1 if x1 < size // 2 else -1
+            y_step = 1 if y1 < size // 2 else -1
+            x_room = size - 1 - x1 if x_step == 1 else x1
+            y_room = size - 1 - y1 if y_step == 1 else y1
+            length = rng.randint(1, min(x_room, y_room))
+            x2, y2 = x1 + x_step * length, y1 + y_step * length
+
+        lines.append(f"{x1},{y1} -> {x2},{y2}\n")
+    return "".join(lines)
+
+
+def main():
+    # The scale can be given as the first argument (ex. "python Day_05_generator.py 100 > input.txt")
+    scale = int(argv[1]) if len(argv) > 1 else 1
+    print(generate_input(scale=scale), end="")
+
+
+if __name__ == "__main__":
+    main()
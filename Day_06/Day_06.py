@@ -1,14 +1,19 @@
 from typing import List
 from collections import defaultdict
 
+import numpy as np
 
-def get_input() -> defaultdict[int]:
+
+def get_input(input_file: str = "Day_06_input.txt") -> defaultdict[int]:
     """
     Generates a defaultdict where the key is the day in the lanternfish's life,
     and the value is the number of lanternfish in that stage. All lanternfish in stage 0
     gives birth to a new lanternfish (in stage 8) and returns to stage 6. All other lanternfish
     continue to progress through stages in decreasing order.
 
+    Args:
+        input_file (str, optional): The path to the input file. Defaults to "Day_06_input.txt".
+
     Returns:
         defaultdict[int]: A dictionary containing the number of lanternfish in each stage of its life
     """
@@ -17,7 +22,7 @@ def get_input() -> defaultdict[int]:
     # Pre-populate all the stages with an initial value of 0
     stage_dict[8] = 0
 
-    for num in open("Day_06_input.txt").readline().split(","):
+    for num in open(input_file).readline().split(","):
         stage_dict[int(num)] += 1
 
     return stage_dict
@@ -54,6 +59,187 @@ def progress_variable_days(stage_dict: defaultdict[int], days: int) -> int:
     return sum(stage_dict.values())
 
 
+class PopulationProjector:
+    """
+    A class to predict the lanternfish population after any number of days, without simulating each day.
+    One day is a linear map of the 9 stage counts, so it is written as a 9x9 transition matrix. The population after n days is then
+    found by exponentiation by squaring, using about log2(n) matrix products instead of n steps. All of the arithmetic is done with
+    Python integers, so the results are exact however large they are.
+    The matrix raised to each power of two is cached, so later queries (at any number of days) reuse the squarings already done
+    """
+
+    STAGES = 9
+
+    def __init__(self, stage_dict: defaultdict[int] = None, modulus: int = None):
+        """
+        Args:
+            stage_dict (defaultdict[int], optional): The initial population, as returned by get_input. It is not modified.
+                Defaults to None, for an empty population (ex. when only stage_responses is needed).
+            modulus (int, optional): If given, all of the arithmetic (and the results) are taken modulo this number. The exact population
+                has about 0.037 * days digits, so very large day counts (ex. 10^12) can only be answered this way. Defaults to None.
+        """
+        stage_dict = stage_dict or {}
+        self._counts = [stage_dict.get(stage, 0) for stage in range(self.STAGES)]
+        self._modulus = modulus
+
+        # Each day, stage s takes the fish from stage s + 1, and the fish in stage 0 move to stages 6 and 8
+        transition = [[0] * self.STAGES for _ in range(self.STAGES)]
+        for stage in range(self.STAGES - 1):
+            transition[stage][stage + 1] = 1
+        transition[self.STAGES - 1][0] = 1
+        transition[self.STAGES - 3][0] = 1
+
+        # The transition matrix raised to the power 2^i, at index i
+        self._powers = [transition]
+
+    def _reduce(self, value: int) -> int:
+        return value if self._modulus is None else value % self._modulus
+
+    def _multiply(
+        self, left: List[List[int]], right: List[List[int]]
+    ) -> List[List[int]]:
+        columns = list(zip(*right))
+        return [
+            [
+                self._reduce(sum(a * b for a, b in zip(row, column)))
+                for column in columns
+            ]
+            for row in left
+        ]
+
+    def _get_power(self, exponent: int) -> List[List[int]]:
+        """
+        Returns the transition matrix raised to the power 2^exponent, squaring the largest cached power as needed
+
+        Args:
+            exponent (int): The power of two
+
+        Returns:
+            List[List[int]]: The transition matrix to the power 2^exponent
+        """
+        while len(self._powers) <= exponent:
+            self._powers.append(self._multiply(self._powers[-1], self._powers[-1]))
+        return self._powers[exponent]
+
+    def stage_counts(self, days: int) -> List[int]:
+        """
+        Predicts the number of lanternfish in each stage after the given number of days
+
+        Args:
+            days (int): The number of days to project for
+
+        Returns:
+            List[int]: The number of lanternfish in each stage, indexed by stage
+        """
+        if days < 0:
+            raise ValueError("The number of days cannot be negative")
+
+        # The powers of the transition matrix commute, so they can be applied to the counts in any order
+        counts = [self._reduce(count) for count in self._counts]
+        exponent = 0
+        while days:
+            if days & 1:
+                power = self._get_power(exponent)
+                counts = [
+                    self._reduce(sum(a * b for a, b in zip(row, counts)))
+                    for row in power
+                ]
+            days >>= 1
+            exponent += 1
+
+        return counts
+
+    def stage_responses(self, days: int) -> List[int]:
+        """
+        Finds the number of lanternfish that a single lanternfish in each stage becomes after the given number of days.
+        The population grows linearly, so the population of any initial state is the dot product of its stage counts and this vector
+
+        Args:
+            days (int): The number of days to project for
+
+        Returns:
+            List[int]: The number of descendants (including itself) of one lanternfish, indexed by its initial stage
+        """
+        if days < 0:
+            raise ValueError("The number of days cannot be negative")
+
+        # The sums of the columns of the transition matrix raised to the power of days
+        responses = [1] * self.STAGES
+        exponent = 0
+        while days:
+            if days & 1:
+                power = self._get_power(exponent)
+                responses = [
+                    self._reduce(sum(a * b for a, b in zip(responses, column)))
+                    for column in zip(*power)
+                ]
+            days >>= 1
+            exponent += 1
+
+        return responses
+
+    def population(self, days: int) -> int:
+        """
+        Predicts the total number of lanternfish after the given number of days
+
+        Args:
+            days (int): The number of days to project for
+
+        Returns:
+            int: The number of lanternfish (modulo the modulus, if one was given)
+        """
+        return self._reduce(sum(self.stage_counts(days)))
+
+
+def forecast_populations(
+    histograms: np.ndarray, horizons: List[int], modulus: int = None
+) -> np.ndarray:
+    """
+    Predicts the populations of many initial states at many numbers of days at once.
+    One response vector is found for each horizon (see PopulationProjector.stage_responses), so each forecast is a single dot
+    product of an initial state with a response vector. The histograms are not modified
+
+    Args:
+        histograms (np.ndarray): An (N, 9) array, where each row is the number of lanternfish in each stage of an initial state
+        horizons (List[int]): The H numbers of days to predict the populations at
+        modulus (int, optional): If given, the populations are taken modulo this number. Defaults to None.
+
+    Returns:
+        np.ndarray: An (N, H) array of the population of each initial state at each horizon. Its dtype is int64 when all of the
+            populations fit, and object (Python integers) otherwise
+    """
+    histograms = np.asarray(histograms)
+    if histograms.ndim != 2 or histograms.shape[1] != PopulationProjector.STAGES:
+        raise ValueError(
+            f"Expected an (N, {PopulationProjector.STAGES}) array of stage histograms"
+        )
+
+    projector = PopulationProjector(modulus=modulus)
+    responses = [projector.stage_responses(days) for days in horizons]
+
+    # Each population is at most the largest response times the largest initial population, so int64 is exact if that fits
+    largest_response = max((max(response) for response in responses), default=0)
+    largest_total = int(np.abs(histograms).sum(axis=1).max(initial=0))
+    if largest_response * largest_total < np.iinfo(np.int64).max:
+        populations = (
+            histograms.astype(np.int64)
+            @ np.array(responses, dtype=np.int64)
+            .reshape(-1, PopulationProjector.STAGES)
+            .T
+        )
+    else:
+        populations = (
+            histograms.astype(object)
+            @ np.array(responses, dtype=object)
+            .reshape(-1, PopulationProjector.STAGES)
+            .T
+        )
+
+    if modulus is not None:
+        populations %= modulus
+    return populations
+
+
 def main():
     stage_dict = get_input()
     print("Answer to part 1:", progress_variable_days(stage_dict=stage_dict, days=80))
@@ -0,0 +1,27 @@
+from random import Random
+from sys import argv
+
+
+def generate_input(scale: int = 1, seed: int = 0) -> str:
+    """
+    Generates the ages of the initial school of lanternfish. Like the puzzle input, all ages are between 1 and 5.
+
+    Args:
+        scale (int, optional): The size of the input compared to the puzzle input (300 lanternfish). Defaults to 1.
+        seed (int, optional): The seed for the random number generator. Defaults to 0.
+
+    Returns:
+        str: The contents of an input file
+    """
+    rng = Random(seed)
+    return ",".join(str(rng.randint(1, 5)) for i in range(0, 300 * scale)) + "\n"
+
+
+def main():
+    # The scale can be given as the first argument (ex. "python Day_06_generator.py 100 > input.txt")
+    scale = int(argv[1]) if len(argv) > 1 else 1
+    print(generate_input(scale=scale), end="")
+
+
+if __name__ == "__main__":
+    main()
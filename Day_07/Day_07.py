@@ -1,5 +1,7 @@
 from statistics import median, mean
-from typing import List
+from typing import Callable, List, Sequence, Tuple, Union
+
+import numpy as np
 
 
 def get_median_cost(positions: List[int]) -> int:
@@ -47,8 +49,162 @@ def get_mean_cost(positions: List[int]) -> int:
     return min(costs)
 
 
-def get_input() -> List[int]:
-    return [int(num) for num in open("Day_07_input.txt").readline().split(",")]
+def get_alignment_costs(
+    positions: List[int],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Returns the exact fuel cost of aligning every crab to every candidate position between the smallest and largest position, for
+    both the linear cost (part 1) and the triangular cost (part 2).
+    The costs come from a histogram of the positions and its prefix sums, so this takes O(range + n) instead of O(range * n).
+    For a target t, the linear cost is the sum of |x - t|, which is split at t into the crabs on the left and on the right:
+        t * count_left - sum_left + sum_right - t * count_right
+    The triangular cost of a distance d is d * (d + 1) / 2, so the triangular cost is (sum of (x - t)^2 + linear cost) / 2, where
+        sum of (x - t)^2 = sum of x^2 - 2 * t * sum of x + t^2 * count
+
+    Args:
+        positions (List[int]): List of positions
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: The candidate positions, and the linear and triangular cost of each of them
+    """
+    positions = np.asarray(positions, dtype=np.int64)
+    lowest = int(positions.min())
+    highest = int(positions.max())
+    count = len(positions)
+
+    # Python integers are used if the largest possible sum of squares does not fit in an int64
+    dtype = np.int64
+    if count * (highest - lowest + 1) ** 2 >= np.iinfo(np.int64).max:
+        dtype = object
+
+    # Work relative to the lowest position, so that the sums stay as small as possible
+    offsets = np.arange(highest - lowest + 1, dtype=np.int64).astype(dtype)
+    histogram = np.bincount(positions - lowest).astype(dtype)
+
+    # The number and sum of the positions to the left of each target (not including the target itself)
+    count_left = np.concatenate([[0], np.cumsum(histogram)[:-1]]).astype(dtype)
+    sum_left = np.concatenate([[0], np.cumsum(histogram * offsets)[:-1]]).astype(dtype)
+    total_sum = (histogram * offsets).sum()
+    total_squares = (histogram * offsets * offsets).sum()
+
+    count_right = count - count_left
+    sum_right = total_sum - sum_left
+    linear = offsets * count_left - sum_left + sum_right - offsets * count_right
+    squares = total_squares - 2 * offsets * total_sum + offsets * offsets * count
+    triangular = (squares + linear) // 2
+
+    return offsets + lowest, linear, triangular
+
+
+def find_optimal_alignment(
+    positions: List[int], triangular: bool = False
+) -> Tuple[int, int]:
+    """
+    Finds the position that the crabs can align to with the least fuel, by checking every candidate position exactly
+
+    Args:
+        positions (List[int]): List of positions
+        triangular (bool, optional): Whether to use the triangular cost (part 2) instead of the linear cost (part 1).
+            Defaults to False.
+
+    Returns:
+        Tuple[int, int]: The best position (the lowest one, if several are equally good) and its total fuel cost
+    """
+    targets, linear, triangular_costs = get_alignment_costs(positions)
+    costs = triangular_costs if triangular else linear
+    best = int(np.argmin(costs))
+    return int(targets[best]), int(costs[best])
+
+
+def linear_cost(distances: np.ndarray) -> np.ndarray:
+    """
+    The fuel cost of moving each distance in part 1, where every step costs 1
+
+    Args:
+        distances (np.ndarray): The distances moved
+
+    Returns:
+        np.ndarray: The fuel cost of each distance
+    """
+    return distances
+
+
+def triangular_cost(distances: np.ndarray) -> np.ndarray:
+    """
+    The fuel cost of moving each distance in part 2, where each step costs 1 more than the last
+
+    Args:
+        distances (np.ndarray): The distances moved
+
+    Returns:
+        np.ndarray: The fuel cost of each distance
+    """
+    return distances * (distances + 1) // 2
+
+
+def find_optimal_target(
+    positions: List[int],
+    cost: Union[Callable[[np.ndarray], np.ndarray], Sequence[int]],
+) -> Tuple[int, int]:
+    """
+    Finds the position that the crabs can align to with the least fuel, for any convex per-distance fuel cost.
+    If the cost of a distance is convex (and increasing), the total cost of aligning to each position is convex too, so the best
+    position is found with an integer ternary search: the search range is halved depending on whether the total cost rises or falls
+    from t to t + 1. This evaluates the total cost O(log range) times instead of at every position.
+    Crabs at the same position are counted together, so each evaluation is one vectorized pass over the distinct positions
+
+    Args:
+        positions (List[int]): List of positions
+        cost (Union[Callable[[np.ndarray], np.ndarray], Sequence[int]]): The fuel cost of each distance. Either a function that takes
+            an array of distances and returns the array of their costs (ex. linear_cost), or a lookup table where cost[d] is the
+            cost of moving a distance d, which must cover every distance up to the largest position minus the smallest
+
+    Returns:
+        Tuple[int, int]: The best position (the lowest one, if several are equally good) and its total fuel cost
+    """
+    targets, counts = np.unique(
+        np.asarray(positions, dtype=np.int64), return_counts=True
+    )
+
+    if not callable(cost):
+        table = np.asarray(cost)
+        if len(table) <= targets[-1] - targets[0]:
+            raise ValueError(
+                f"The cost table must cover every distance up to {targets[-1] - targets[0]}"
+            )
+        cost = table.__getitem__
+
+    crab_count = int(counts.sum())
+
+    def get_total_cost(target: int):
+        costs = np.asarray(cost(np.abs(targets - target)))
+
+        # Python integers are used if the total of integer costs might not fit in an int64
+        if (
+            costs.dtype.kind in "iu"
+            and len(costs)
+            and int(costs.max()) * crab_count >= np.iinfo(np.int64).max
+        ):
+            costs = costs.astype(object)
+        return (costs * counts).sum()
+
+    # Find the lowest position where the total cost stops falling
+    low = int(targets[0])
+    high = int(targets[-1])
+    while low < high:
+        middle = (low + high) // 2
+        if get_total_cost(middle) <= get_total_cost(middle + 1):
+            high = middle
+        else:
+            low = middle + 1
+
+    # Integer and float totals are returned as Python numbers, while object totals already are
+    total = get_total_cost(low)
+    return low, total.item() if hasattr(total, "item") else total
+
+
+def get_input(input_file: str = "Day_07_input.txt") -> List[int]:
+    return [int(num) for num in open(input_file).readline().split(",")]
 
 
 def main():
@@ -0,0 +1,32 @@
+from random import Random
+from sys import argv
+
+
+def generate_input(scale: int = 1, seed: int = 0) -> str:
+    """
+    Generates the horizontal positions of the crabs. Like the puzzle input, most crabs are close to 0 and a few are far away.
+
+    Args:
+        scale (int, optional): The size of the input compared to the puzzle input (1000 crabs). Defaults to 1.
+        seed (int, optional): The seed for the random number generator. Defaults to 0.
+
+    Returns:
+        str: The contents of an input file
+    """
+    rng = Random(seed)
+    return (
+        ",".join(
+            str(min(int(abs(rng.gauss(0, 600))), 1999)) for i in range(0, 1000 * scale)
+        )
+        + "\n"
+    )
+
+
+def main():
+    # The scale can be given as the first argument (ex. "python Day_07_generator.py 100 > input.txt")
+    scale = int(argv[1]) if len(argv) > 1 else 1
+    print(generate_input(scale=scale), end="")
+
+
+if __name__ == "__main__":
+    main()
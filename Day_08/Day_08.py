@@ -1,6 +1,32 @@
 from re import findall
 from typing import Tuple, List
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from os import cpu_count, path
+
+import numpy as np
+
+SEGMENTS = "abcdefg"
+
+# The bit of each segment in a pattern's bitmask (see encode_pattern)
+SEGMENT_MASKS = {segment: 1 << index for index, segment in enumerate(SEGMENTS)}
+
+# The number of lit segments in each 7-bit mask
+SEGMENT_COUNTS = [bin(mask).count("1") for mask in range(1 << len(SEGMENTS))]
+
+# The segments that are lit for each digit when the display is wired correctly, indexed by digit
+CANONICAL_PATTERNS = [
+    "abcefg",
+    "cf",
+    "acdeg",
+    "acdfg",
+    "bcdf",
+    "abdfg",
+    "abdefg",
+    "acf",
+    "abcdefg",
+    "abcdfg",
+]
 
 
 class Display:
@@ -9,9 +35,9 @@ class Display:
         self.output = output
 
 
-def get_input() -> List[Display]:
+def get_input(input_file: str = "Day_08_input.txt") -> List[Display]:
     displays = []
-    with open("Day_08_input.txt") as file:
+    with open(input_file) as file:
         for line in file.readlines():
             pattern, output = line.split("|")
             displays.append(
@@ -112,6 +138,257 @@ def get_output(display: Display) -> int:
     return output
 
 
+def encode_pattern(pattern: str) -> int:
+    """
+    Encodes a pattern as a 7-bit mask, where bit i is set if segment i (a to g) is lit
+
+    Args:
+        pattern (str): The letters of the lit segments
+
+    Returns:
+        int: The bitmask of the pattern
+    """
+    mask = 0
+    for segment in pattern:
+        mask |= SEGMENT_MASKS[segment]
+    return mask
+
+
+def get_signatures(masks: List[int]) -> List[int]:
+    """
+    Finds a signature for each pattern that does not depend on how the segments are wired.
+    Each segment is lit in a fixed number of the 10 digits (ex. segment e is only lit in 0, 2, 6 and 8), however the wires are
+    mixed up. The signature of a pattern is the sum of these frequencies over its lit segments, which is different for every digit.
+    That sum is found from the masks, as the number of lit segments that the pattern shares with each of the 10 patterns
+
+    Args:
+        masks (List[int]): The bitmasks of the 10 patterns of a display
+
+    Returns:
+        List[int]: The signature of each pattern
+    """
+    # The sum of the frequencies of a pattern's segments is the number of segments it shares with each of the 10 patterns
+    return [sum(SEGMENT_COUNTS[mask & other] for other in masks) for mask in masks]
+
+
+# Maps the signature of each digit to the digit, found from the correctly wired patterns
+SIGNATURE_DIGITS = {
+    signature: digit
+    for digit, signature in enumerate(
+        get_signatures([encode_pattern(pattern) for pattern in CANONICAL_PATTERNS])
+    )
+}
+
+
+def decode_output(display: Display) -> int:
+    """
+    Same as get_output, but decodes each digit with a single lookup instead of comparing sets.
+    The patterns and output digits are encoded as bitmasks, and the signature of each output digit (see get_signatures) is found
+    from the masks of the display's 10 patterns, then looked up in SIGNATURE_DIGITS
+
+    Args:
+        display (Display): A Display class variable
+
+    Returns:
+        int: The number that the output represents
+    """
+    masks = [encode_pattern(pattern) for pattern in display.pattern]
+
+    output = 0
+    for digit in display.output:
+        digit_mask = encode_pattern(digit)
+        signature = sum(SEGMENT_COUNTS[digit_mask & mask] for mask in masks)
+        output = output * 10 + SIGNATURE_DIGITS[signature]
+    return output
+
+
+# Maps each byte to the bit of its segment (a to g), and every other byte to 0
+SEGMENT_BITS = np.zeros(256, dtype=np.uint8)
+for segment_index, segment in enumerate(SEGMENTS):
+    SEGMENT_BITS[ord(segment)] = 1 << segment_index
+
+# Maps each signature (see get_signatures) to its digit, or 255 for signatures that no digit has
+SIGNATURE_LOOKUP = np.full(max(SIGNATURE_DIGITS) + 1, 255, dtype=np.uint8)
+for signature, digit in SIGNATURE_DIGITS.items():
+    SIGNATURE_LOOKUP[signature] = digit
+
+
+def parse_masks(data: bytes) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Parses the text of the input into bitmasks (see encode_pattern), without splitting it into strings.
+    Every run of segment letters is a pattern, so the bits of each letter are combined with a single reduceat over the runs.
+    Raises a ValueError for any line without exactly 10 patterns before its "|" and 4 output digits after it
+
+    Args:
+        data (bytes): The text of the input
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: An (N, 10) uint8 array of the patterns and an (N, 4) uint8 array of the outputs of each display
+    """
+    codes = np.frombuffer(data, dtype=np.uint8)
+    bits = SEGMENT_BITS[codes]
+    is_segment = bits != 0
+
+    # A pattern starts at every segment letter that does not follow another segment letter
+    starts = is_segment.copy()
+    starts[1:] &= ~is_segment[:-1]
+
+    # Check that every line that is not blank has 10 patterns, then a "|", then 4 output digits
+    newlines = codes == ord("\n")
+    line_numbers = np.cumsum(newlines)
+    line_count = int(np.count_nonzero(newlines)) + 1
+    bars_so_far = np.cumsum(codes == ord("|"))
+    bars_before_line = np.concatenate([[0], bars_so_far[newlines]])
+    run_positions = np.flatnonzero(starts)
+    run_lines = line_numbers[run_positions]
+    is_output = bars_so_far[run_positions] > bars_before_line[run_lines]
+    pattern_counts = np.bincount(run_lines[~is_output], minlength=line_count)
+    output_counts = np.bincount(run_lines[is_output], minlength=line_count)
+    bar_counts = np.bincount(line_numbers[codes == ord("|")], minlength=line_count)
+    is_invalid = ((pattern_counts + output_counts + bar_counts) > 0) & (
+        (pattern_counts != 10) | (output_counts != 4) | (bar_counts != 1)
+    )
+    if is_invalid.any():
+        raise ValueError(
+            f"Line {int(np.argmax(is_invalid)) + 1} must have 10 patterns, a | and 4 output digits"
+        )
+
+    masks = (
+        np.bitwise_or.reduceat(bits[is_segment], np.flatnonzero(starts[is_segment]))
+        if len(run_positions)
+        else bits[:0]
+    )
+    masks = masks.reshape(-1, 14)
+    return masks[:, :10], masks[:, 10:]
+
+
+def get_input_masks(
+    input_file: str = "Day_08_input.txt",
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Same as get_input, but reads the whole file at once into bitmask arrays (see parse_masks)
+
+    Args:
+        input_file (str, optional): The path to the input file. Defaults to "Day_08_input.txt".
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: An (N, 10) uint8 array of the patterns and an (N, 4) uint8 array of the outputs of each display
+    """
+    with open(input_file, "rb") as file:
+        return parse_masks(file.read())
+
+
+def decode_masks(
+    patterns: np.ndarray, outputs: np.ndarray, batch_size: int = 1 << 16
+) -> np.ndarray:
+    """
+    Same as decode_output, but decodes every display at once with array operations.
+    For each batch of displays, the frequency of each segment is counted over the 10 patterns, and each output digit is looked up by
+    the sum of its segments' frequencies (its signature). The batches keep the temporary (batch, 10, 7) arrays small
+
+    Args:
+        patterns (np.ndarray): An (N, 10) array of the pattern bitmasks of each display
+        outputs (np.ndarray): An (N, 4) array of the output bitmasks of each display
+        batch_size (int, optional): The number of displays to decode at once. Defaults to 65536.
+
+    Returns:
+        np.ndarray: The number that the output of each display represents
+    """
+    shifts = np.arange(len(SEGMENTS), dtype=np.uint8)
+    place_values = np.array([1000, 100, 10, 1], dtype=np.int64)
+    values = np.empty(len(patterns), dtype=np.int64)
+
+    for start in range(0, len(patterns), batch_size):
+        pattern_bits = (patterns[start : start + batch_size, :, None] >> shifts) & 1
+        output_bits = (outputs[start : start + batch_size, :, None] >> shifts) & 1
+        frequencies = pattern_bits.sum(axis=1, dtype=np.int64)
+        signatures = (output_bits * frequencies[:, None, :]).sum(axis=2)
+
+        digits = SIGNATURE_LOOKUP[np.minimum(signatures, len(SIGNATURE_LOOKUP) - 1)]
+        if (digits == 255).any():
+            raise ValueError("A display has an output that does not match any digit")
+        values[start : start + batch_size] = digits @ place_values
+
+    return values
+
+
+def split_line_ranges(input_file: str, count: int) -> List[Tuple[int, int]]:
+    """
+    Splits a file into about count byte ranges of whole lines, so that no display is split between two ranges.
+    Each boundary is found by seeking to an even share of the file and reading on to the end of that line
+
+    Args:
+        input_file (str): The path to the input file
+        count (int): The number of ranges to aim for
+
+    Returns:
+        List[Tuple[int, int]]: The (start, end) byte offsets of each range
+    """
+    size = path.getsize(input_file)
+    boundaries = [0]
+    with open(input_file, "rb") as file:
+        for i in range(1, count):
+            file.seek(max(size * i // count, boundaries[-1]))
+            file.readline()
+            if file.tell() >= size:
+                break
+            if file.tell() > boundaries[-1]:
+                boundaries.append(file.tell())
+    if boundaries[-1] < size:
+        boundaries.append(size)
+    return list(zip(boundaries[:-1], boundaries[1:]))
+
+
+def decode_range(input_file: str, start: int, end: int) -> np.ndarray:
+    """
+    Parses and decodes the displays in a single byte range of the file. Runs in a worker process
+
+    Args:
+        input_file (str): The path to the input file
+        start (int): The offset of the first byte of the range
+        end (int): The offset just past the last byte of the range
+
+    Returns:
+        np.ndarray: The number that the output of each display in the range represents
+    """
+    with open(input_file, "rb") as file:
+        file.seek(start)
+        patterns, outputs = parse_masks(file.read(end - start))
+    return decode_masks(patterns, outputs)
+
+
+def decode_file(
+    input_file: str = "Day_08_input.txt", processes: int = None, chunks: int = None
+) -> np.ndarray:
+    """
+    Decodes the output of every display in a file. The file is split into ranges of whole lines, and each range is parsed and decoded
+    in its own worker process. With a single process, the whole file is decoded in this process instead
+
+    Args:
+        input_file (str, optional): The path to the input file. Defaults to "Day_08_input.txt".
+        processes (int, optional): The number of worker processes. Defaults to the number of CPUs.
+        chunks (int, optional): The number of ranges to split the file into. Defaults to 4 per process.
+
+    Returns:
+        np.ndarray: The number that the output of each display represents, in the order of the file
+    """
+    processes = processes or cpu_count() or 1
+    if processes == 1:
+        return decode_masks(*get_input_masks(input_file))
+
+    ranges = split_line_ranges(input_file, chunks or processes * 4)
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        results = list(
+            executor.map(
+                decode_range,
+                [input_file] * len(ranges),
+                [start for start, end in ranges],
+                [end for start, end in ranges],
+            )
+        )
+    return np.concatenate(results) if results else np.empty(0, dtype=np.int64)
+
+
 def wrapper(part_1: bool, part_2: bool, displays: List[Display]):
     """
     Is a wrapper class to execute the appropriate functions for each display in the input
@@ -0,0 +1,55 @@
+from random import Random
+from sys import argv
+
+# The segments that are lit for each digit on a display that is wired correctly
+DIGIT_SEGMENTS = [
+    "abcefg",
+    "cf",
+    "acdeg",
+    "acdfg",
+    "bcdf",
+    "abdfg",
+    "abdefg",
+    "acf",
+    "abcdefg",
+    "abcdfg",
+]
+
+
+def generate_input(scale: int = 1, seed: int = 0) -> str:
+    """
+    Generates the notes for each display. Each display has its own random wiring, and the letters within each pattern are
+    shuffled, as the order of the letters is not significant.
+
+    Args:
+        scale (int, optional): The size of the input compared to the puzzle input (200 displays). Defaults to 1.
+        seed (int, optional): The seed for the random number generator. Defaults to 0.
+
+    Returns:
+        str: The contents of an input file
+    """
+    rng = Random(seed)
+    lines = []
+    for i in range(0, 200 * scale):
+        wiring = dict(zip("abcdefg", rng.sample("abcdefg", 7)))
+
+        # Wire each segment of a digit to its scrambled segment, in a random order
+        def scramble(digit: int) -> str:
+            segments = [wiring[segment] for segment in DIGIT_SEGMENTS[digit]]
+            rng.shuffle(segments)
+            return "".join(segments)
+
+        patterns = [scramble(digit) for digit in rng.sample(range(0, 10), 10)]
+        output = [scramble(rng.randrange(0, 10)) for j in range(0, 4)]
+        lines.append(" ".join(patterns) + " | " + " ".join(output) + "\n")
+    return "".join(lines)
+
+
+def main():
+    # The scale can be given as the first argument (ex. "python Day_08_generator.py 100 > input.txt")
+    scale = int(argv[1]) if len(argv) > 1 else 1
+    print(generate_input(scale=scale), end="")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,22 @@
-from typing import List, Tuple
+from typing import Iterable, Iterator, List, Tuple, Union
+from heapq import nlargest
 from re import findall
 
+import numpy as np
 
-def get_input() -> List[List[int]]:
+
+def get_input(input_file: str = "Day_09_input.txt") -> List[List[int]]:
     """
     Returns the input string as a 2-dimensional integer list
 
+    Args:
+        input_file (str, optional): The path to the input file. Defaults to "Day_09_input.txt".
+
     Returns:
         List[List[int]]: A two dimensional list of integers
     """
     return [
-        list(map(int, findall(r"[0-9]", line)))
-        for line in open("Day_09_input.txt").readlines()
+        list(map(int, findall(r"[0-9]", line))) for line in open(input_file).readlines()
     ]
 
 
@@ -58,6 +63,52 @@ def get_min_risk_levels(height_map: List[List[int]]) -> int:
     return local_min_count
 
 
+def get_input_array(input_file: str = "Day_09_input.txt") -> np.ndarray:
+    """
+    Same as get_input, but reads the height map into a 2-dimensional uint8 array
+
+    Args:
+        input_file (str, optional): The path to the input file. Defaults to "Day_09_input.txt".
+
+    Returns:
+        np.ndarray: The height of each point, indexed by row and column
+    """
+    with open(input_file, "rb") as file:
+        lines = file.read().split()
+    if not lines:
+        return np.zeros((0, 0), dtype=np.uint8)
+    return (np.frombuffer(b"".join(lines), dtype=np.uint8) - ord("0")).reshape(
+        len(lines), -1
+    )
+
+
+def find_low_points(height_map: np.ndarray) -> Tuple[int, np.ndarray]:
+    """
+    Same as get_min_risk_levels, but compares whole shifted views of the map instead of looping over each point.
+    The map is padded with a sentinel that is higher than any height, so points on the edges only need to be lower than their
+    neighbours inside the map. A low point must be strictly lower than all four of its neighbours
+
+    Args:
+        height_map (np.ndarray): A 2-dimensional array of heights, from get_input_array
+
+    Returns:
+        Tuple[int, np.ndarray]: The sum of all (low point height + 1), and a (n, 2) array of the (row, column) of each low point
+    """
+    height_map = np.asarray(height_map, dtype=np.uint8)
+    padded = np.pad(height_map, 1, constant_values=np.iinfo(np.uint8).max)
+    center = padded[1:-1, 1:-1]
+
+    low_points = center < padded[:-2, 1:-1]
+    low_points &= center < padded[2:, 1:-1]
+    low_points &= center < padded[1:-1, :-2]
+    low_points &= center < padded[1:-1, 2:]
+
+    risk = int(center[low_points].sum(dtype=np.int64)) + int(
+        np.count_nonzero(low_points)
+    )
+    return risk, np.argwhere(low_points)
+
+
 def get_basins(height_map: List[List[int]]) -> int:
     """
     Evalueates the given 2-Dimensional list for all basins. Basins are defined as submaps
@@ -125,6 +176,338 @@ def get_basins(height_map: List[List[int]]) -> int:
     return basin_sizes[0] * basin_sizes[1] * basin_sizes[2]
 
 
+def iter_height_rows(
+    source: Union[str, Iterable[Iterable[int]]],
+) -> Iterator[np.ndarray]:
+    """
+    Yields the height map one row at a time, so that the whole map never needs to be in memory
+
+    Args:
+        source (Union[str, Iterable[Iterable[int]]]): The path to an input file, or the rows of a height map (ex. from get_input or
+            get_input_array). The rows are only read
+
+    Yields:
+        Iterator[np.ndarray]: Each row of heights, as a uint8 array
+    """
+    if isinstance(source, str):
+        with open(source, "rb") as file:
+            for line in file:
+                line = line.strip()
+                if line:
+                    yield np.frombuffer(line, dtype=np.uint8) - ord("0")
+    else:
+        for row in source:
+            yield np.asarray(row, dtype=np.uint8)
+
+
+def find_root(parents: List[int], label: int) -> int:
+    """
+    Finds the root label of the basin that a label belongs to, pointing every label on the way directly at the root (path compression)
+
+    Args:
+        parents (List[int]): The parent of each label. A root is its own parent
+        label (int): The label to find the root of
+
+    Returns:
+        int: The root label
+    """
+    root = label
+    while parents[root] != root:
+        root = parents[root]
+    while parents[label] != root:
+        parents[label], label = root, parents[label]
+    return root
+
+
+def label_row_runs(row: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Labels each run of non-9 points in a row, from 0 in order from left to right
+
+    Args:
+        row (np.ndarray): A row of heights
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The label of each point in the row (or -1 for the 9s), and the number of points in each run
+    """
+    in_basin = row != 9
+    run_starts = in_basin.copy()
+    run_starts[1:] &= ~in_basin[:-1]
+    labels = np.where(in_basin, np.cumsum(run_starts) - 1, -1)
+    return labels, np.bincount(
+        labels[in_basin], minlength=int(np.count_nonzero(run_starts))
+    )
+
+
+def get_touching_runs(
+    previous_labels: np.ndarray, labels: np.ndarray
+) -> Iterator[Tuple[int, int]]:
+    """
+    Finds the pairs of runs in two neighbouring rows that touch, and so belong to the same basin
+
+    Args:
+        previous_labels (np.ndarray): The run labels of the row above, from label_row_runs
+        labels (np.ndarray): The run labels of the row below, from label_row_runs
+
+    Returns:
+        Iterator[Tuple[int, int]]: The (label above, label below) of each pair of touching runs
+    """
+    touching = (previous_labels >= 0) & (labels >= 0)
+    above_labels = previous_labels[touching]
+    below_labels = labels[touching]
+
+    # Neighbouring columns of the same two runs give the same pair, so only the first of them is kept
+    new_pair = np.ones(len(above_labels), dtype=bool)
+    new_pair[1:] = (above_labels[1:] != above_labels[:-1]) | (
+        below_labels[1:] != below_labels[:-1]
+    )
+    return zip(above_labels[new_pair].tolist(), below_labels[new_pair].tolist())
+
+
+def label_basin_runs(
+    source: Union[str, Iterable[Iterable[int]]],
+    parents: List[int],
+    run_sizes: List[int],
+) -> Iterator[np.ndarray]:
+    """
+    Scans the map one row at a time, keeping only the labels of the previous row.
+    Each run of non-9 points in a row gets a new label. A run that touches a labelled point in the row above belongs to the same basin,
+    so the two labels are merged in a union-find. The union-find is kept in parents, where the larger root always points to the smaller
+
+    Args:
+        source (Union[str, Iterable[Iterable[int]]]): The path to an input file (which is streamed), or the rows of a height map.
+            The height map is not modified
+        parents (List[int]): The parent of each label, which is extended as new runs are labelled
+        run_sizes (List[int]): The number of points in each label's run, which is extended as new runs are labelled
+
+    Yields:
+        Iterator[np.ndarray]: The label of each point in each row, or -1 for the 9s between the basins
+    """
+    previous_labels = None
+
+    for row in iter_height_rows(source):
+        # Label each run of points in a basin, following on from the labels used so far
+        labels, sizes = label_row_runs(row)
+        labels = np.where(labels >= 0, labels + len(parents), -1)
+        run_sizes.extend(sizes.tolist())
+        parents.extend(range(len(parents), len(parents) + len(sizes)))
+
+        # Merge the runs that touch a run in the previous row
+        if previous_labels is not None:
+            for above, below in get_touching_runs(previous_labels, labels):
+                above = find_root(parents, above)
+                below = find_root(parents, below)
+                if above != below:
+                    parents[max(above, below)] = min(above, below)
+
+        previous_labels = labels
+        yield labels
+
+
+def resolve_roots(parents: List[int]) -> np.ndarray:
+    """
+    Finds the root of every label in a union-find built by label_basin_runs
+
+    Args:
+        parents (List[int]): The parent of each label
+
+    Returns:
+        np.ndarray: The root label of each label
+    """
+    # Every label points to a smaller label, so repeatedly following the parents reaches the roots
+    roots = np.array(parents, dtype=np.int64)
+    while True:
+        next_roots = roots[roots]
+        if np.array_equal(next_roots, roots):
+            return roots
+        roots = next_roots
+
+
+def iter_basin_sizes(source: Union[str, Iterable[Iterable[int]]]) -> Iterator[int]:
+    """
+    Finds the size of every basin by scanning the map one row at a time, keeping only the basins that reach the previous row.
+    The runs of each new row are merged with the open basins that they touch, in a union-find that is rebuilt for every row. An open
+    basin that no run of the new row touches can not grow any more, so its size is yielded and it is forgotten. The open basins
+    are then renumbered from 0, so the state never grows beyond the width of the map, however many rows are streamed
+
+    Args:
+        source (Union[str, Iterable[Iterable[int]]]): The path to an input file (which is streamed), or the rows of a height map.
+            The height map is not modified
+
+    Yields:
+        Iterator[int]: The size of each basin, in the order that the basins are finished
+    """
+    previous_labels = None
+    # The open basin of each run in the previous row, and the size of each open basin so far
+    run_basins = np.zeros(0, dtype=np.int64)
+    basin_sizes = np.zeros(0, dtype=np.int64)
+
+    for row in iter_height_rows(source):
+        labels, run_sizes = label_row_runs(row)
+
+        # The open basins are numbered first in the union-find, followed by the runs of the new row
+        basin_count = len(basin_sizes)
+        parents = list(range(basin_count + len(run_sizes)))
+        if previous_labels is not None:
+            for above, below in get_touching_runs(previous_labels, labels):
+                above = find_root(parents, int(run_basins[above]))
+                below = find_root(parents, basin_count + below)
+                if above != below:
+                    parents[max(above, below)] = min(above, below)
+
+        roots = np.array(
+            [find_root(parents, node) for node in range(len(parents))], dtype=np.int64
+        )
+        totals = np.zeros(len(parents), dtype=np.int64)
+        np.add.at(totals, roots, np.concatenate([basin_sizes, run_sizes]))
+
+        # The larger root always points to the smaller one, so a basin that stays open is the root of every run it merged with
+        run_roots = roots[basin_count:]
+        finished = np.ones(basin_count, dtype=bool)
+        finished[run_roots[run_roots < basin_count]] = False
+        finished &= roots[:basin_count] == np.arange(basin_count)
+        yield from totals[:basin_count][finished].tolist()
+
+        open_roots, run_basins = np.unique(run_roots, return_inverse=True)
+        run_basins = run_basins.reshape(-1)
+        basin_sizes = totals[open_roots]
+        previous_labels = labels
+
+    yield from basin_sizes.tolist()
+
+
+def get_basin_sizes(source: Union[str, Iterable[Iterable[int]]]) -> np.ndarray:
+    """
+    Collects the sizes from iter_basin_sizes into an array
+
+    Args:
+        source (Union[str, Iterable[Iterable[int]]]): The path to an input file (which is streamed), or the rows of a height map.
+            The height map is not modified
+
+    Returns:
+        np.ndarray: The size of each basin, in the order that the basins are finished
+    """
+    return np.fromiter(iter_basin_sizes(source), dtype=np.int64)
+
+
+def get_basins_union_find(source: Union[str, Iterable[Iterable[int]]]) -> int:
+    """
+    Same as get_basins, but finds the basins with get_basin_sizes, so the height map is not modified and can be streamed from a file
+
+    Args:
+        source (Union[str, Iterable[Iterable[int]]]): The path to an input file, or the rows of a height map
+
+    Returns:
+        int: The product of the three largest basin sizes
+    """
+    sizes = get_basin_sizes(source)
+    return int(np.prod(np.sort(sizes)[::-1][:3]))
+
+
+class BasinMap:
+    """
+    A class to answer many questions about the basins of one height map, after labelling the basins only once.
+    Every point is labelled with the number of its basin (numbered in the order that they are first reached, from 0), or -1 for the
+    9s between the basins. The bounding boxes and the low points are only found the first time that they are needed, and then kept
+    """
+
+    def __init__(self, height_map: Union[str, Iterable[Iterable[int]]]):
+        """
+        Args:
+            height_map (Union[str, Iterable[Iterable[int]]]): The path to an input file, or the rows of a height map.
+                The height map is not modified
+        """
+        # The rows are read once, so that a file is only read once and any iterable of rows can be used
+        rows = list(iter_height_rows(height_map))
+        self._heights = np.stack(rows) if rows else np.zeros((0, 0), dtype=np.uint8)
+
+        parents = []
+        run_sizes = []
+        run_labels = np.array(
+            list(label_basin_runs(self._heights, parents, run_sizes)), dtype=np.int64
+        ).reshape(self._heights.shape)
+
+        # Number the basins by their roots, which are in the order that the basins are first reached
+        basin_roots, basin_numbers = np.unique(
+            resolve_roots(parents), return_inverse=True
+        )
+        self.labels = np.full(self._heights.shape, -1, dtype=np.int32)
+        in_basin = run_labels >= 0
+        self.labels[in_basin] = basin_numbers.reshape(-1)[run_labels[in_basin]]
+        self.sizes = np.bincount(self.labels[in_basin], minlength=len(basin_roots))
+        self._bounding_boxes = None
+        self._low_point_basins = None
+
+    def get_basin_count(self) -> int:
+        """
+        Returns:
+            int: The number of basins
+        """
+        return len(self.sizes)
+
+    def get_largest_sizes(self, count: int = 3) -> List[int]:
+        """
+        Finds the sizes of the largest basins, using a heap instead of sorting every basin
+
+        Args:
+            count (int, optional): The number of basins. Defaults to 3.
+
+        Returns:
+            List[int]: The largest sizes, from largest to smallest
+        """
+        return nlargest(count, self.sizes.tolist())
+
+    def get_basin(self, row: int, col: int) -> int:
+        """
+        Finds the basin that a point belongs to
+
+        Args:
+            row (int): The row of the point
+            col (int): The column of the point
+
+        Returns:
+            int: The number of the basin, or None if the point is a 9 and belongs to no basin
+        """
+        basin = int(self.labels[row, col])
+        return None if basin < 0 else basin
+
+    def get_bounding_box(self, basin: int) -> Tuple[int, int, int, int]:
+        """
+        Finds the smallest rectangle that contains a basin
+
+        Args:
+            basin (int): The number of the basin
+
+        Returns:
+            Tuple[int, int, int, int]: The (min row, min column, max row, max column) of the basin, all inclusive
+        """
+        if self._bounding_boxes is None:
+            rows, cols = np.nonzero(self.labels >= 0)
+            basins = self.labels[rows, cols]
+            boxes = np.empty((len(self.sizes), 4), dtype=np.int64)
+            boxes[:, :2] = np.iinfo(np.int64).max
+            boxes[:, 2:] = -1
+            np.minimum.at(boxes[:, 0], basins, rows)
+            np.minimum.at(boxes[:, 1], basins, cols)
+            np.maximum.at(boxes[:, 2], basins, rows)
+            np.maximum.at(boxes[:, 3], basins, cols)
+            self._bounding_boxes = boxes
+        return tuple(self._bounding_boxes[basin].tolist())
+
+    def get_low_point_basins(self) -> dict:
+        """
+        Finds the basin that each low point (see find_low_points) drains into
+
+        Returns:
+            dict: Maps the (row, column) of each low point to the number of its basin
+        """
+        if self._low_point_basins is None:
+            risk, low_points = find_low_points(self._heights)
+            self._low_point_basins = {
+                (row, col): self.get_basin(row, col) for row, col in low_points.tolist()
+            }
+        return dict(self._low_point_basins)
+
+
 def main():
     height_map = get_input()
     print("Answer to Part 1:", get_min_risk_levels(height_map))
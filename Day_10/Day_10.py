@@ -1,6 +1,17 @@
 from typing import List, Tuple
 from collections import deque, defaultdict
 from statistics import median
+from random import Random
+
+# Maps each opening bracket to the closing bracket that it expects
+CLOSING_BRACKETS = {"(": ")", "[": "]", "{": "}", "<": ">"}
+
+# The corruption score of each closing bracket, as defined in the problem specification
+CORRUPTION_POINTS = {")": 3, "]": 57, "}": 1197, ">": 25137}
+
+# Translates each closing bracket into its completion score (1 to 4). The completion score of a line multiplies by 5 for each bracket,
+# so the translated brackets are the digits of the score in base 5
+COMPLETION_DIGITS = str.maketrans(")]}>", "1234")
 
 
 def lookup_close(bracket: str) -> str:
@@ -65,8 +76,8 @@ def lookup_correct_points(bracket: str) -> int:
         return 4
 
 
-def get_input() -> List[str]:
-    return [line.strip() for line in open("Day_10_input.txt").readlines()]
+def get_input(input_file: str = "Day_10_input.txt") -> List[str]:
+    return [line.strip() for line in open(input_file).readlines()]
 
 
 def find_and_discard_corrupted_lines(lines: List[str]) -> Tuple[int, List[str]]:
@@ -162,12 +173,101 @@ def fix_incomplete_lines(lines: List[str]) -> int:
     return median(correct_scores)
 
 
+def score_line(line: str) -> Tuple[int, int]:
+    """
+    Scans a line once with its own stack of the closing brackets that are still expected.
+    A line is corrupted at its first closing bracket that does not match the expected one (or that has nothing to close).
+    Otherwise, the expected brackets left on the stack (in reverse) complete the line
+
+    Args:
+        line (str): A line of brackets
+
+    Returns:
+        Tuple[int, int]: The corruption score and None for a corrupted line, or 0 and the completion score for any other line
+    """
+    expected = []
+    for bracket in line:
+        closing = CLOSING_BRACKETS.get(bracket)
+        if closing is not None:
+            expected.append(closing)
+        elif not expected or expected.pop() != bracket:
+            return CORRUPTION_POINTS[bracket], None
+
+    if not expected:
+        return 0, 0
+    return 0, int("".join(reversed(expected)).translate(COMPLETION_DIGITS), 5)
+
+
+def select_kth(values: List[int], k: int, seed: int = 0) -> int:
+    """
+    Finds the kth smallest value (counting from 0) with quickselect, which takes O(n) on average instead of sorting every value.
+    The values are not modified
+
+    Args:
+        values (List[int]): The values to select from
+        k (int): The rank of the value to find
+        seed (int, optional): The seed for choosing the pivots. Defaults to 0.
+
+    Returns:
+        int: The kth smallest value
+    """
+    pivots = Random(seed)
+    while True:
+        pivot = values[pivots.randrange(len(values))]
+        lower = [value for value in values if value < pivot]
+        if k < len(lower):
+            values = lower
+            continue
+
+        equal_count = sum(1 for value in values if value == pivot)
+        if k < len(lower) + equal_count:
+            return pivot
+
+        k -= len(lower) + equal_count
+        values = [value for value in values if value > pivot]
+
+
+def validate_lines(lines: List[str]) -> Tuple[int, int]:
+    """
+    Same as running find_and_discard_corrupted_lines and then fix_incomplete_lines, but scans each line only once (see score_line) and
+    finds the median with quickselect. The lines are not modified
+
+    Args:
+        lines (List[str]): The set of lines, which is the input
+
+    Returns:
+        Tuple[int, int]: The total corruption score, and the median completion score of the lines that are not corrupted
+            (or None if every line is corrupted)
+    """
+    corruption_score = 0
+    completion_scores = []
+    for line in lines:
+        corruption, completion = score_line(line)
+        corruption_score += corruption
+        if completion is not None:
+            completion_scores.append(completion)
+
+    if not completion_scores:
+        return corruption_score, None
+
+    # Same as statistics.median, which averages the two middle scores when there is an even number of them
+    middle = len(completion_scores) // 2
+    if len(completion_scores) % 2 == 1:
+        return corruption_score, select_kth(completion_scores, middle)
+    return (
+        corruption_score,
+        (
+            select_kth(completion_scores, middle - 1)
+            + select_kth(completion_scores, middle)
+        )
+        / 2,
+    )
+
+
 def main():
-    lines = get_input()
-    incorrect_score, incomplete_lines = find_and_discard_corrupted_lines(lines=lines)
-    print("Answer to Part 1:", incorrect_score)
-    correct_score = fix_incomplete_lines(lines=incomplete_lines)
-    print("Answer to Part 2:", correct_score)
+    corruption_score, completion_score = validate_lines(lines=get_input())
+    print("Answer to Part 1:", corruption_score)
+    print("Answer to Part 2:", completion_score)
 
 
 if __name__ == "__main__":
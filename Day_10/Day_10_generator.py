@@ -0,0 +1,60 @@
+from random import Random
+from sys import argv
+
+CLOSE = {"(": ")", "[": "]", "{": "}", "<": ">"}
+
+
+def generate_input(scale: int = 1, seed: int = 0) -> str:
+    """
+    Generates lines of brackets that are either corrupted or incomplete, about half of each. Corrupted lines stop at their first
+    illegal closing bracket, so that each line has a single score. There is always an odd number of incomplete lines,
+    so that the median completion score is one of the scores.
+
+    Args:
+        scale (int, optional): The size of the input compared to the puzzle input (100 lines). Defaults to 1.
+        seed (int, optional): The seed for the random number generator. Defaults to 0.
+
+    Returns:
+        str: The contents of an input file
+    """
+    rng = Random(seed)
+    count = 100 * scale
+    lines = []
+    incomplete_count = 0
+    for i in range(0, count):
+        # The last line is made incomplete if the number of incomplete lines would otherwise be even
+        corrupted = rng.random() < 0.5
+        if i == count - 1:
+            corrupted = incomplete_count % 2 == 1
+        if not corrupted:
+            incomplete_count += 1
+
+        line = []
+        stack = []
+        for j in range(0, rng.randint(80, 110)):
+            if len(stack) == 0 or rng.random() < 0.55:
+                stack.append(rng.choice("([{<"))
+                line.append(stack[-1])
+            else:
+                line.append(CLOSE[stack.pop()])
+
+        # Make sure an incomplete line has brackets left to complete
+        if len(stack) == 0:
+            stack.append(rng.choice("([{<"))
+            line.append(stack[-1])
+
+        if corrupted:
+            line.append(rng.choice([c for c in ")]}>" if c != CLOSE[stack[-1]]]))
+
+        lines.append("".join(line))
+    return "".join(line + "\n" for line in lines)
+
+
+def main():
+    # The scale can be given as the first argument (ex. "python Day_10_generator.py 100 > input.txt")
+    scale = int(argv[1]) if len(argv) > 1 else 1
+    print(generate_input(scale=scale), end="")
+
+
+if __name__ == "__main__":
+    main()
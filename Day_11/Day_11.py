@@ -2,11 +2,8 @@ from typing import List, Tuple, Set
 from copy import copy
 
 
-def get_input() -> List[List[int]]:
-    return [
-        [int(num) for num in line.strip()]
-        for line in open("Day_11_input.txt").readlines()
-    ]
+def get_input(input_file: str = "Day_11_input.txt") -> List[List[int]]:
+    return [[int(num) for num in line.strip()] for line in open(input_file).readlines()]
 
 
 def get_adj_coor(row: int, col: int) -> List[Tuple[int]]:
@@ -0,0 +1,33 @@
+from math import sqrt
+from random import Random
+from sys import argv
+
+
+def generate_input(scale: int = 1, seed: int = 0) -> str:
+    """
+    Generates a map of energy levels. The levels are between 0 and 5 rather than 0 and 9, as maps that use every level
+    rarely synchronize and Part 2 would never finish. Maps with levels up to 5 synchronize within a few dozen steps.
+    Both sides of the map grow with the square root of the scale, so the number of octopuses grows with the scale.
+
+    Args:
+        scale (int, optional): The size of the input compared to the puzzle input (10 x 10 octopuses). Defaults to 1.
+        seed (int, optional): The seed for the random number generator. Defaults to 0.
+
+    Returns:
+        str: The contents of an input file
+    """
+    rng = Random(seed)
+    side = round(10 * sqrt(scale))
+    return "".join(
+        "".join(rng.choices("012345", k=side)) + "\n" for row in range(0, side)
+    )
+
+
+def main():
+    # The scale can be given as the first argument (ex. "python Day_11_generator.py 100 > input.txt")
+    scale = int(argv[1]) if len(argv) > 1 else 1
+    print(generate_input(scale=scale), end="")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,16 +2,19 @@ from collections import defaultdict
 from typing import DefaultDict, List
 
 
-def get_input() -> DefaultDict[str, List[str]]:
+def get_input(input_file: str = "Day_12_input.txt") -> DefaultDict[str, List[str]]:
     """
     Reads the input data from a file and returns it in the form of a DefaultDict.
     The problem specificies that this is not to be an directed graph, so distinguishing parents from children is not necessary.
 
+    Args:
+        input_file (str, optional): The path to the input file. Defaults to "Day_12_input.txt".
+
     Returns:
         DefaultDict[str, List[str]]: A DefaultDict, where the key is the node, and the value is the list of connected nodes
     """
     cave_mappings = defaultdict(list)
-    for line in open("Day_12_input.txt").readlines():
+    for line in open(input_file).readlines():
         cave_pair = line.strip().split("-")
         cave_mappings[cave_pair[0]].append(cave_pair[1])
         cave_mappings[cave_pair[1]].append(cave_pair[0])
@@ -0,0 +1,69 @@
+from random import Random
+from sys import argv
+
+
+def get_cave_name(num: int) -> str:
+    """
+    Helper function to turn a number into a unique lowercase name (0 -> "a", 23 -> "z", 24 -> "ba").
+    The letters "e" and "s" are left out, so that a cave can never be named "end" or "start"
+
+    Args:
+        num (int): The number to name
+
+    Returns:
+        str: The lowercase name
+    """
+    name = ""
+    while True:
+        name = "abcdfghijklmnopqrtuvwxyz"[num % 24] + name
+        num //= 24
+        if num == 0:
+            return name
+
+
+def generate_input(scale: int = 1, seed: int = 0) -> str:
+    """
+    Generates a cave system made of separate groups of caves that are only joined by "start" and "end".
+    The number of paths grows exponentially with the size of a connected cave system, so the groups are kept small and the number
+    of groups grows with the scale instead. Each group has three small caves and a big cave, joined by randomly chosen tunnels.
+    Big caves are never joined to each other, as the number of paths would be infinite.
+
+    Args:
+        scale (int, optional): The size of the input compared to the puzzle input (about 24 tunnels). Defaults to 1.
+        seed (int, optional): The seed for the random number generator. Defaults to 0.
+
+    Returns:
+        str: The contents of an input file
+    """
+    rng = Random(seed)
+    tunnels = []
+    for group in range(0, 4 * scale):
+        small = [get_cave_name(group * 3 + i) for i in range(0, 3)]
+        big = get_cave_name(group).upper()
+
+        # Make sure the group is connected to both "start" and "end"
+        tunnels.append(("start", small[0]))
+        tunnels.append((small[0], big))
+        tunnels.append((big, "end"))
+        for pair in [
+            (small[0], small[1]),
+            (small[1], big),
+            (small[2], big),
+            (small[1], small[2]),
+            (small[2], "end"),
+        ]:
+            if rng.random() < 0.6:
+                tunnels.append(pair)
+
+    rng.shuffle(tunnels)
+    return "".join(f"{a}-{b}\n" for a, b in tunnels)
+
+
+def main():
+    # The scale can be given as the first argument (ex. "python Day_12_generator.py 100 > input.txt")
+    scale = int(argv[1]) if len(argv) > 1 else 1
+    print(generate_input(scale=scale), end="")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,17 +2,22 @@ from typing import Tuple, Set, List
 from regex import search
 
 
-def get_input() -> Tuple[Set[Tuple[int, int]], List[Tuple[str, int]]]:
+def get_input(
+    input_file: str = "Day_13_input.txt",
+) -> Tuple[Set[Tuple[int, int]], List[Tuple[str, int]]]:
     """
     Read in the input data
 
+    Args:
+        input_file (str, optional): The path to the input file. Defaults to "Day_13_input.txt".
+
     Returns:
         Set[Tuple[int, int]], List[Tuple[str, int]]: Returns a set of coordinates and a list of instructions.
         One coordinate or instruction is represented as a tuple
     """
     coordinates = set()
     instructions = []
-    with open("Day_13_input.txt") as file:
+    with open(input_file) as file:
         line = file.readline().strip()
         # The coordinates and instructions are separated by a newline
         while line != "":
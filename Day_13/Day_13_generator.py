@@ -0,0 +1,62 @@
+from math import ceil, log
+from random import Random
+from sys import argv
+
+
+def generate_input(scale: int = 1, seed: int = 0) -> str:
+    """
+    Generates the dots and the fold instructions. The dots are first placed on the final 40 x 6 sheet, and then each fold is undone
+    by randomly reflecting the dots, so no dot ever lies on a fold line.
+    Like the puzzle input, the paper starts at 1311 x 895 and is folded in half 12 times. For larger scales, the paper gets an extra
+    fold in each direction whenever the scale has grown by a factor of 4.
+
+    Args:
+        scale (int, optional): The size of the input compared to the puzzle input (about 800 dots). Defaults to 1.
+        seed (int, optional): The seed for the random number generator. Defaults to 0.
+
+    Returns:
+        str: The contents of an input file
+    """
+    rng = Random(seed)
+    extra_folds = ceil(log(scale, 4)) if scale > 1 else 0
+
+    # Each fold halves the paper, so the width before the fold is twice the width after it, plus the fold line
+    x_folds = [40]
+    for i in range(0, 4 + extra_folds):
+        x_folds.append(x_folds[-1] * 2 + 1)
+    y_folds = [6]
+    for i in range(0, 6 + extra_folds):
+        y_folds.append(y_folds[-1] * 2 + 1)
+
+    # The final sheet uses about a third of its positions
+    letters = rng.sample([(x, y) for x in range(0, 40) for y in range(0, 6)], 80)
+
+    dots = set()
+    while len(dots) < 800 * scale:
+        x, y = rng.choice(letters)
+        for fold in x_folds:
+            if rng.random() < 0.5:
+                x = fold * 2 - x
+        for fold in y_folds:
+            if rng.random() < 0.5:
+                y = fold * 2 - y
+        dots.add((x, y))
+
+    instructions = []
+    for i in range(0, max(len(x_folds), len(y_folds))):
+        if i < len(x_folds):
+            instructions.append(f"fold along x={x_folds[-1 - i]}\n")
+        if i < len(y_folds):
+            instructions.append(f"fold along y={y_folds[-1 - i]}\n")
+
+    return "".join(f"{x},{y}\n" for x, y in dots) + "\n" + "".join(instructions)
+
+
+def main():
+    # The scale can be given as the first argument (ex. "python Day_13_generator.py 100 > input.txt")
+    scale = int(argv[1]) if len(argv) > 1 else 1
+    print(generate_input(scale=scale), end="")
+
+
+if __name__ == "__main__":
+    main()
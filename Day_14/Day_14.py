@@ -2,16 +2,21 @@ from collections import defaultdict, deque, Counter
 from typing import DefaultDict, Counter
 
 
-def get_input() -> tuple[str, DefaultDict[str, str]]:
+def get_input(
+    input_file: str = "Day_14_input.txt",
+) -> tuple[str, DefaultDict[str, str]]:
     """
     Read the input data and return the template and instructions for polymer production.
 
+    Args:
+        input_file (str, optional): The path to the input file. Defaults to "Day_14_input.txt".
+
     Returns:
         tuple[str, DefaultDict[str, str]]: A tuple containing the initial template, and a dict of polymer construction instructions
     """
     template = ""
     instructions = defaultdict(str)
-    with open("Day_14_input.txt") as file:
+    with open(input_file) as file:
         template = file.readline().strip()
         file.readline()
         for line in file.readlines():
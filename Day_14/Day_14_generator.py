@@ -0,0 +1,32 @@
+from random import Random
+from sys import argv
+
+ELEMENTS = "BCFHKNOPSV"
+
+
+def generate_input(scale: int = 1, seed: int = 0) -> str:
+    """
+    Generates the polymer template and the pair insertion rules. Like the puzzle input, there are 10 elements and a rule for
+    every pair of elements. Only the template grows with the scale, as the number of rules is fixed by the number of elements.
+
+    Args:
+        scale (int, optional): The size of the input compared to the puzzle input (a template of 20 elements). Defaults to 1.
+        seed (int, optional): The seed for the random number generator. Defaults to 0.
+
+    Returns:
+        str: The contents of an input file
+    """
+    rng = Random(seed)
+    template = "".join(rng.choices(ELEMENTS, k=20 * scale))
+    rules = [f"{a}{b} -> {rng.choice(ELEMENTS)}\n" for a in ELEMENTS for b in ELEMENTS]
+    return template + "\n\n" + "".join(rules)
+
+
+def main():
+    # The scale can be given as the first argument (ex. "python Day_14_generator.py 100 > input.txt")
+    scale = int(argv[1]) if len(argv) > 1 else 1
+    print(generate_input(scale=scale), end="")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,20 +2,20 @@ from collections import namedtuple
 from sys import maxsize
 
 
-def get_input() -> list[list[int]]:
+def get_input(input_file: str = "Day_15_input.txt") -> list[list[int]]:
     """
     Get the input data and return it as a nested integer list.
     A better data structure could have been used here. I consulted other solutions online after finishing this one, and saw
     many approaches using dictionaries instead of a list. A dictionary would have been a better choice, as I use Dijkstra's algorithm,
     and with dictionaries finding neighbours is less complicated (as I would not need to worry about coordinates falling out of bounds)
 
+    Args:
+        input_file (str, optional): The path to the input file. Defaults to "Day_15_input.txt".
+
     Returns:
         [type]: list[list[int]]
     """
-    return [
-        [int(num) for num in line.strip()]
-        for line in open("Day_15_input.txt").readlines()
-    ]
+    return [[int(num) for num in line.strip()] for line in open(input_file).readlines()]
 
 
 def find_shortest_cost(graph: list[list[int]]) -> int:
@@ -0,0 +1,32 @@
+from math import sqrt
+from random import Random
+from sys import argv
+
+
+def generate_input(scale: int = 1, seed: int = 0) -> str:
+    """
+    Generates a map of risk levels between 1 and 9.
+    Both sides of the map grow with the square root of the scale, so the number of positions grows with the scale.
+
+    Args:
+        scale (int, optional): The size of the input compared to the puzzle input (100 x 100 positions). Defaults to 1.
+        seed (int, optional): The seed for the random number generator. Defaults to 0.
+
+    Returns:
+        str: The contents of an input file
+    """
+    rng = Random(seed)
+    side = round(100 * sqrt(scale))
+    return "".join(
+        "".join(rng.choices("123456789", k=side)) + "\n" for row in range(0, side)
+    )
+
+
+def main():
+    # The scale can be given as the first argument (ex. "python Day_15_generator.py 100 > input.txt")
+    scale = int(argv[1]) if len(argv) > 1 else 1
+    print(generate_input(scale=scale), end="")
+
+
+if __name__ == "__main__":
+    main()
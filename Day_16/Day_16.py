@@ -10,8 +10,8 @@ class TreeNode:
         self.parents = []
 
 
-def get_input() -> str:
-    return open("Day_16_input.txt").readline().strip()
+def get_input(input_file: str = "Day_16_input.txt") -> str:
+    return open(input_file).readline().strip()
 
 
 def unpack(packet_str: str) -> TreeNode:
@@ -0,0 +1,87 @@
+from math import ceil
+from random import Random
+from sys import argv
+
+
+def encode_packet(rng: Random, depth: int, children: int = None) -> str:
+    """
+    Recursively generates a random packet and returns its binary string.
+    Comparison packets (types 5, 6 and 7) always get exactly two sub-packets, and packets deeper than 4 levels are always literals.
+
+    Args:
+        rng (Random): The random number generator
+        depth (int): The depth of the packet in the packet tree
+        children (int, optional): The number of sub-packets to give to a sum packet. Defaults to None, for a random packet.
+
+    Returns:
+        str: The binary string of the packet
+    """
+    version = format(rng.randrange(0, 8), "03b")
+
+    if children is None:
+        packet_type = rng.choice([0, 1, 2, 3, 4, 4, 4, 5, 6, 7]) if depth < 4 else 4
+    else:
+        packet_type = 0
+
+    # A literal value is split into groups of 4 bits. Every group except the last is prefixed with a 1
+    if packet_type == 4:
+        value = format(rng.randrange(0, 2**12), "b")
+        value = "0" * (-len(value) % 4) + value
+        groups = [value[i : i + 4] for i in range(0, len(value), 4)]
+        return (
+            version
+            + "100"
+            + "".join("1" + group for group in groups[:-1])
+            + "0"
+            + groups[-1]
+        )
+
+    if children is None:
+        children = 2 if packet_type >= 5 else rng.randint(1, 4)
+    sub_packets = "".join(encode_packet(rng, depth + 1) for i in range(0, children))
+
+    # Use the bit length when it fits in 15 bits, otherwise the sub-packet count (which must fit in 11 bits)
+    if rng.random() < 0.5 and len(sub_packets) < 2**15:
+        length = "0" + format(len(sub_packets), "015b")
+    else:
+        length = "1" + format(children, "011b")
+    return version + format(packet_type, "03b") + length + sub_packets
+
+
+def generate_input(scale: int = 1, seed: int = 0) -> str:
+    """
+    Generates a hexadecimal transmission. The outermost packet is a sum packet, and its sub-packets are random packet trees.
+    Sum packets are nested so that no packet has more sub-packets than the 11 bit count can hold.
+
+    Args:
+        scale (int, optional): The size of the input compared to the puzzle input (about 5000 bits). Defaults to 1.
+        seed (int, optional): The seed for the random number generator. Defaults to 0.
+
+    Returns:
+        str: The contents of an input file
+    """
+    rng = Random(seed)
+    trees = 20 * scale
+    groups = ceil(trees / 2000)
+    if groups == 1:
+        packet = encode_packet(rng, depth=0, children=trees)
+    else:
+        packet = "".join(
+            encode_packet(rng, depth=0, children=ceil(trees / groups))
+            for i in range(0, groups)
+        )
+        packet = "000" + "000" + "1" + format(groups, "011b") + packet
+
+    # Pad the packet with zeros to a whole number of hexadecimal digits
+    packet += "0" * (-len(packet) % 4)
+    return format(int(packet, 2), "0" + str(len(packet) // 4) + "X") + "\n"
+
+
+def main():
+    # The scale can be given as the first argument (ex. "python Day_16_generator.py 100 > input.txt")
+    scale = int(argv[1]) if len(argv) > 1 else 1
+    print(generate_input(scale=scale), end="")
+
+
+if __name__ == "__main__":
+    main()
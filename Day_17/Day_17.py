@@ -2,14 +2,17 @@ from random import gauss
 from regex import findall
 
 
-def get_input() -> tuple[tuple[int], tuple[int]]:
+def get_input(input_file: str = "Day_17_input.txt") -> tuple[tuple[int], tuple[int]]:
     """
     Read in the input data and return the target square's x and y ranges as a tuple
 
+    Args:
+        input_file (str, optional): The path to the input file. Defaults to "Day_17_input.txt".
+
     Returns:
         tuple[tuple[int], tuple[int]]: A tuple for the x range and a tuple for the y range
     """
-    coordinates = findall(r"-?[0-9]+", open("Day_17_input.txt").readline())
+    coordinates = findall(r"-?[0-9]+", open(input_file).readline())
     x_bounds = (int(coordinates[0]), int(coordinates[1]))
     y_bounds = (int(coordinates[2]), int(coordinates[3]))
     return x_bounds, y_bounds
@@ -0,0 +1,32 @@
+from random import Random
+from sys import argv
+
+
+def generate_input(scale: int = 1, seed: int = 0) -> str:
+    """
+    Generates the target area. The target area is placed further away from the launcher as the scale grows.
+    The number of velocities to check grows with the square of the distance, so the running time grows much faster than the scale.
+
+    Args:
+        scale (int, optional): The distance of the target area compared to the puzzle input (about x=150, y=-100). Defaults to 1.
+        seed (int, optional): The seed for the random number generator. Defaults to 0.
+
+    Returns:
+        str: The contents of an input file
+    """
+    rng = Random(seed)
+    x1 = rng.randint(120, 160) * scale
+    y1 = -rng.randint(80, 120) * scale
+    x2 = x1 + rng.randint(20, 40) * scale
+    y2 = y1 + rng.randint(15, 30) * scale
+    return f"target area: x={x1}..{x2}, y={y1}..{y2}\n"
+
+
+def main():
+    # The scale can be given as the first argument (ex. "python Day_17_generator.py 100 > input.txt")
+    scale = int(argv[1]) if len(argv) > 1 else 1
+    print(generate_input(scale=scale), end="")
+
+
+if __name__ == "__main__":
+    main()
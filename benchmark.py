@@ -0,0 +1,267 @@
+"""
+Measures how the running time and memory of each day's solution grow with the size of its input.
+For every day and scale, an input is generated with the day's generator (ex. Day_05/Day_05_generator.py) and measured with runner.py.
+The growth of each step is reported as the exponent k in "time ~ scale^k", fitted over all of the scales that were run.
+Each scale is run several times (until --min-time seconds have passed, up to --max-repeats runs) and the fastest time of each step
+is kept, so that steps taking well under a millisecond still give a meaningful exponent.
+An exponent of about 1 means the step is linear in the size of the input, and an exponent of about 2 means it is quadratic.
+
+Usage:
+    python benchmark.py                         Runs every day at 1x, 10x and 100x the puzzle input
+    python benchmark.py 5 15 --scales 1 4 16    Runs Day 5 and Day 15 at 1x, 4x and 16x
+    python benchmark.py --format json           Prints the report as JSON instead of a table
+"""
+
+from argparse import ArgumentParser
+from json import dumps
+from math import log
+from os import makedirs, path
+from tempfile import TemporaryDirectory
+from typing import List
+
+from runner import PARTS, load_day, run_day
+
+
+def fit_exponent(scales: List[int], values: List[float]) -> float:
+    """
+    Fits "value ~ scale^k" with a least squares fit of log(value) against log(scale), and returns k
+
+    Args:
+        scales (List[int]): The scales that were measured
+        values (List[float]): The measurement at each scale
+
+    Returns:
+        float: The exponent k, or None if there are fewer than two usable measurements
+    """
+    points = [
+        (log(scale), log(value))
+        for scale, value in zip(scales, values)
+        if value is not None and value > 0
+    ]
+    if len(points) < 2:
+        return None
+
+    mean_x = sum(x for x, y in points) / len(points)
+    mean_y = sum(y for x, y in points) / len(points)
+    spread = sum((x - mean_x) ** 2 for x, y in points)
+    if spread == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / spread
+
+
+def get_total_time(report: dict) -> float:
+    """
+    Returns the total wall-clock time of a report from run_day()
+
+    Args:
+        report (dict): The report returned by run_day()
+
+    Returns:
+        float: The wall-clock time of the parse step and all of the parts, in seconds
+    """
+    return report["parse"]["wall"] + sum(part["wall"] for part in report["parts"])
+
+
+def benchmark_day(
+    day: int,
+    scales: List[int],
+    seed: int = 0,
+    trace_memory: bool = True,
+    time_limit: float = None,
+    input_dir: str = None,
+    min_time: float = 0.5,
+    max_repeats: int = 20,
+) -> dict:
+    """
+    Generates an input for each scale and measures the day's solution on it. The scales are run from smallest to largest.
+
+    Args:
+        day (int): The day number
+        scales (List[int]): The scales to run
+        seed (int, optional): The seed for the generator. Defaults to 0.
+        trace_memory (bool, optional): Whether to measure the peak memory. Defaults to True.
+        time_limit (float, optional): Once a scale takes longer than this many seconds, the larger scales are skipped.
+            Defaults to None, for no limit.
+        input_dir (str, optional): The folder to keep the generated inputs in. Defaults to None, for a temporary folder.
+        min_time (float, optional): Each scale is run again until its runs add up to this many seconds. Defaults to 0.5.
+        max_repeats (int, optional): The most times to run each scale. Defaults to 20.
+
+    Returns:
+        dict: The report for the day, containing the scales that were run and the measurements of each step at each scale
+    """
+    generator = load_day(day, module="_generator")
+
+    with TemporaryDirectory() as temp_dir:
+        reports = []
+        for scale in sorted(scales):
+            input_file = path.join(
+                input_dir or temp_dir, f"Day_{day:02d}_input_x{scale}.txt"
+            )
+            with open(input_file, "w") as file:
+                file.write(generator.generate_input(scale=scale, seed=seed))
+
+            # The peak memory does not change between runs, so it is only traced on the first run
+            report = run_day(day, input_file=input_file, trace_memory=trace_memory)
+            total = get_total_time(report)
+            elapsed = total
+            repeats = 1
+            while elapsed < min_time and repeats < max_repeats:
+                repeat = run_day(day, input_file=input_file, trace_memory=False)
+                elapsed += get_total_time(repeat)
+                repeats += 1
+
+                # Keep the fastest time of each step
+                for step, repeat_step in zip(
+                    [report["parse"]] + report["parts"],
+                    [repeat["parse"]] + repeat["parts"],
+                ):
+                    step["wall"] = min(step["wall"], repeat_step["wall"])
+                    step["cpu"] = min(step["cpu"], repeat_step["cpu"])
+            reports.append((scale, report))
+
+            if time_limit is not None and total > time_limit:
+                break
+
+    run_scales = [scale for scale, report in reports]
+    steps = {"Parse": [report["parse"] for scale, report in reports]}
+    for i, (name, part) in enumerate(PARTS[day]):
+        steps[name] = [report["parts"][i] for scale, report in reports]
+
+    return {
+        "day": day,
+        "scales": run_scales,
+        "steps": [
+            {
+                "step": name,
+                "wall": [stats["wall"] for stats in measurements],
+                "cpu": [stats["cpu"] for stats in measurements],
+                "peak": [stats["peak"] for stats in measurements],
+                "time_exponent": fit_exponent(
+                    run_scales, [stats["wall"] for stats in measurements]
+                ),
+                "memory_exponent": fit_exponent(
+                    run_scales, [stats["peak"] for stats in measurements]
+                ),
+            }
+            for name, measurements in steps.items()
+        ],
+    }
+
+
+def format_table(reports: List[dict], scales: List[int]) -> str:
+    """
+    Formats the reports from benchmark_day() as a plain text table.
+    Scales that were skipped because of the time limit are shown as "-"
+
+    Args:
+        reports (List[dict]): The reports returned by benchmark_day()
+        scales (List[int]): All of the scales that were requested
+
+    Returns:
+        str: The table, with one row for each parse step and part
+    """
+    scales = sorted(scales)
+    header = ["Day", "Step"]
+    header += [f"x{scale} (ms)" for scale in scales]
+    header += [f"x{scale} (KiB)" for scale in scales]
+    header += ["Time ~ n^k", "Memory ~ n^k"]
+
+    rows = []
+    for report in reports:
+        for step in report["steps"]:
+            wall = dict(zip(report["scales"], step["wall"]))
+            peak = dict(zip(report["scales"], step["peak"]))
+            row = [str(report["day"]), step["step"]]
+            row += [
+                f"{wall[scale] * 1000:.3f}" if scale in wall else "-"
+                for scale in scales
+            ]
+            row += [
+                f"{peak[scale] / 1024:.1f}" if peak.get(scale) is not None else "-"
+                for scale in scales
+            ]
+            row += [
+                "-" if exponent is None else f"{exponent:.2f}"
+                for exponent in (step["time_exponent"], step["memory_exponent"])
+            ]
+            rows.append(row)
+
+    widths = [max(len(row[i]) for row in [header] + rows) for i in range(len(header))]
+    lines = ["  ".join(cell.ljust(width) for cell, width in zip(header, widths))]
+    lines.append("  ".join("-" * width for width in widths))
+    for row in rows:
+        lines.append("  ".join(cell.ljust(width) for cell, width in zip(row, widths)))
+    return "\n".join(lines)
+
+
+def main():
+    parser = ArgumentParser(
+        description="Measures how each day's solution grows with the size of its input"
+    )
+    parser.add_argument(
+        "days", type=int, nargs="*", help="The days to run. Defaults to all days"
+    )
+    parser.add_argument(
+        "--scales",
+        type=int,
+        nargs="+",
+        default=[1, 10, 100],
+        help="The sizes of the generated inputs, compared to the puzzle input",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--format", choices=["table", "json"], default="table")
+    parser.add_argument(
+        "--skip-memory",
+        action="store_true",
+        help="Do not measure the peak memory, which halves the running time",
+    )
+    parser.add_argument(
+        "--time-limit",
+        type=float,
+        default=60,
+        help="Skip the larger scales of a day once one scale takes longer than this many seconds",
+    )
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.5,
+        help="Run each scale again until its runs add up to this many seconds, keeping the fastest time of each step",
+    )
+    parser.add_argument(
+        "--max-repeats",
+        type=int,
+        default=20,
+        help="The most times to run each scale",
+    )
+    parser.add_argument("--keep", help="A folder to keep the generated inputs in")
+    args = parser.parse_args()
+
+    days = args.days or sorted(PARTS.keys())
+    for day in days:
+        if day not in PARTS:
+            parser.error(f"There is no solution for day {day}")
+    if args.keep is not None:
+        makedirs(args.keep, exist_ok=True)
+
+    reports = [
+        benchmark_day(
+            day,
+            scales=args.scales,
+            seed=args.seed,
+            trace_memory=not args.skip_memory,
+            time_limit=args.time_limit,
+            input_dir=args.keep,
+            min_time=args.min_time,
+            max_repeats=args.max_repeats,
+        )
+        for day in days
+    ]
+
+    if args.format == "json":
+        print(dumps(reports, indent=4))
+    else:
+        print(format_table(reports, scales=args.scales))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,382 @@
+"""
+Runs the solutions for each day from one place and reports how long each part takes.
+For every day, the input is parsed with the day's get_input() and each part function is then run on a fresh copy of the
+parsed input. The parse step and each part report the wall-clock time, the CPU time and the peak memory (as traced by tracemalloc).
+
+Usage:
+    python runner.py                        Runs every day on its own puzzle input
+    python runner.py 5 15                   Runs only Day 5 and Day 15
+    python runner.py 1 --input depths.txt   Runs Day 1 on a different input file
+    python runner.py --format json          Prints the report as JSON instead of a table
+"""
+
+from argparse import ArgumentParser
+from copy import deepcopy
+from importlib.util import module_from_spec, spec_from_file_location
+from json import dumps
+from os import path
+from time import perf_counter, process_time
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Tuple
+import tracemalloc
+
+ROOT = path.dirname(path.abspath(__file__))
+
+# The part functions for each day. Each part is given the day's module and its parsed input, and returns the answer
+PARTS: Dict[int, List[Tuple[str, Callable[[ModuleType, Any], Any]]]] = {
+    1: [
+        ("Part 1", lambda day, depths: day.increase_count_one_depth(depths=depths)),
+        ("Part 2", lambda day, depths: day.increase_count_three_depths(depths=depths)),
+    ],
+    2: [
+        (
+            "Part 1",
+            lambda day, directions: day.get_final_position(
+                day.ShipPosition(enable_aim=False), directions
+            ),
+        ),
+        (
+            "Part 2",
+            lambda day, directions: day.get_final_position(
+                day.ShipPosition(enable_aim=True), directions
+            ),
+        ),
+    ],
+    3: [
+        (
+            "Part 1",
+            lambda day, diagnostics: day.find_gamma_epsilon_product(
+                diagnostics=diagnostics[0], bin_len=diagnostics[1]
+            ),
+        ),
+        (
+            "Part 2",
+            lambda day, diagnostics: day.find_o2_co2_product(
+                diagnostics=diagnostics[0], bin_len=diagnostics[1]
+            ),
+        ),
+    ],
+    4: [
+        ("Part 1", lambda day, bingo: day.find_first_winning_score(*bingo)),
+        ("Part 2", lambda day, bingo: day.find_last_winning_score(*bingo)),
+    ],
+    5: [
+        (
+            "Part 1",
+            lambda day, pairs: day.count_overlapping_coordinates(
+                pairs, include_diagonals=False
+            ),
+        ),
+        (
+            "Part 2",
+            lambda day, pairs: day.count_overlapping_coordinates(
+                pairs, include_diagonals=True
+            ),
+        ),
+    ],
+    6: [
+        (
+            "Part 1",
+            lambda day, stage_dict: day.progress_variable_days(
+                stage_dict=stage_dict, days=80
+            ),
+        ),
+        (
+            "Part 2",
+            lambda day, stage_dict: day.progress_variable_days(
+                stage_dict=stage_dict, days=256
+            ),
+        ),
+    ],
+    7: [
+        ("Part 1", lambda day, positions: day.get_median_cost(positions=positions)),
+        ("Part 2", lambda day, positions: day.get_mean_cost(positions=positions)),
+    ],
+    8: [
+        (
+            "Part 1",
+            lambda day, displays: day.wrapper(
+                part_1=True, part_2=False, displays=displays
+            ),
+        ),
+        (
+            "Part 2",
+            lambda day, displays: day.wrapper(
+                part_1=False, part_2=True, displays=displays
+            ),
+        ),
+    ],
+    9: [
+        ("Part 1", lambda day, height_map: day.get_min_risk_levels(height_map)),
+        ("Part 2", lambda day, height_map: day.get_basins(height_map=height_map)),
+    ],
+    10: [
+        ("Part 1", lambda day, lines: day.validate_lines(lines=lines)[0]),
+        ("Part 2", lambda day, lines: day.validate_lines(lines=lines)[1]),
+    ],
+    11: [
+        (
+            "Part 1",
+            lambda day, levels: day.count_flashes(levels_map=levels, cycles=100),
+        ),
+        ("Part 2", lambda day, levels: day.find_synchronized_step(levels_map=levels)),
+    ],
+    12: [
+        (
+            "Part 1",
+            lambda day, cave_mappings: len(
+                day.find_all_paths(cave_mappings=cave_mappings)
+            ),
+        ),
+        (
+            "Part 2",
+            lambda day, cave_mappings: len(
+                day.find_all_paths(
+                    cave_mappings=cave_mappings, visit_small_cave_twice=True
+                )
+            ),
+        ),
+    ],
+    13: [
+        (
+            "Part 1",
+            lambda day, paper: len(
+                day.fold_paper(coordinates=paper[0], instructions=paper[1], step_amt=1)
+            ),
+        ),
+        (
+            "Part 2",
+            lambda day, paper: day.pretty_print_coordinates(
+                coordinates=day.fold_paper(coordinates=paper[0], instructions=paper[1])
+            ),
+        ),
+    ],
+    14: [
+        (
+            "Part 1",
+            lambda day, polymer: day.extend_polymer(
+                template=polymer[0], ins=polymer[1], steps=10
+            ),
+        ),
+        (
+            "Part 2",
+            lambda day, polymer: day.extend_polymer(
+                template=polymer[0], ins=polymer[1], steps=40
+            ),
+        ),
+    ],
+    15: [
+        ("Part 1", lambda day, graph: day.find_shortest_cost(graph)),
+        (
+            "Part 2",
+            lambda day, graph: day.find_shortest_cost(day.extend_map(graph, 5)),
+        ),
+    ],
+    16: [
+        (
+            "Part 1",
+            lambda day, packet: day.get_version_sum(root=day.unpack(packet_str=packet)),
+        ),
+        (
+            "Part 2",
+            lambda day, packet: day.do_packet_instructions(
+                node=day.unpack(packet_str=packet)
+            ),
+        ),
+    ],
+    17: [
+        ("Part 1", lambda day, bounds: day.get_max_y(y_bounds=bounds[1])),
+        (
+            "Part 2",
+            lambda day, bounds: len(
+                day.get_all_starts(x_bounds=bounds[0], y_bounds=bounds[1])
+            ),
+        ),
+    ],
+}
+
+
+def load_day(day: int, module: str = "") -> ModuleType:
+    """
+    Imports a module for a day (ex. Day_05/Day_05.py) without needing the day's folder to be a package
+
+    Args:
+        day (int): The day number
+        module (str, optional): The suffix of the module to import (ex. "_generator" for Day_05/Day_05_generator.py).
+            Defaults to "", for the day's solution.
+
+    Returns:
+        ModuleType: The imported module
+    """
+    name = f"Day_{day:02d}"
+    spec = spec_from_file_location(
+        name + module, path.join(ROOT, name, name + module + ".py")
+    )
+    module = module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def get_default_input(day: int) -> str:
+    """
+    Returns the path to the puzzle input that is checked in for a day
+
+    Args:
+        day (int): The day number
+
+    Returns:
+        str: The path to the day's input file
+    """
+    name = f"Day_{day:02d}"
+    return path.join(ROOT, name, name + "_input.txt")
+
+
+def measure(
+    func: Callable[..., Any],
+    trace_memory: bool = True,
+    setup: Callable[[], Any] = None,
+) -> Tuple[Any, dict]:
+    """
+    Calls the function and measures the wall-clock time and CPU time it takes. Tracing memory slows the function down
+    considerably, so when trace_memory is set the function is called a second time with tracemalloc running to find the peak memory.
+    The function must therefore be safe to call twice.
+
+    Args:
+        func (Callable[..., Any]): The function to measure
+        trace_memory (bool, optional): Whether to also measure the peak memory. Defaults to True.
+        setup (Callable[[], Any], optional): Called before each call of the function, outside of the measurement, and its result is
+            passed to the function (ex. to give each call a fresh copy of its input). Defaults to None, for no argument.
+
+    Returns:
+        Tuple[Any, dict]: The function's return value, and a dict containing "wall" and "cpu" (in seconds) and "peak" (in bytes)
+    """
+    args = () if setup is None else (setup(),)
+    wall_start = perf_counter()
+    cpu_start = process_time()
+    result = func(*args)
+    cpu = process_time() - cpu_start
+    wall = perf_counter() - wall_start
+
+    peak = None
+    if trace_memory:
+        args = () if setup is None else (setup(),)
+        tracemalloc.start()
+        func(*args)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return result, {"wall": wall, "cpu": cpu, "peak": peak}
+
+
+def run_day(day: int, input_file: str = None, trace_memory: bool = True) -> dict:
+    """
+    Parses the input for a day and runs all of its parts, measuring each step.
+    Every part is given its own deep copy of the parsed input, as some parts modify their input (ex. Day 6 and Day 9).
+    The copy is made outside of the measurement.
+
+    Args:
+        day (int): The day number
+        input_file (str, optional): The path to the input file. Defaults to the day's checked in puzzle input.
+        trace_memory (bool, optional): Whether to measure the peak memory. Defaults to True.
+
+    Returns:
+        dict: The report for the day, containing the parse measurement and a list of measurements for each part
+    """
+    if input_file is None:
+        input_file = get_default_input(day)
+    module = load_day(day)
+
+    parsed, parse_stats = measure(
+        lambda: module.get_input(input_file=input_file), trace_memory=trace_memory
+    )
+
+    parts = []
+    for name, part in PARTS[day]:
+        answer, stats = measure(
+            lambda copy, part=part: part(module, copy),
+            trace_memory=trace_memory,
+            # Make a fresh copy for each call, as measure() may call the part twice
+            setup=lambda: deepcopy(parsed),
+        )
+        parts.append({"part": name, "answer": answer, **stats})
+
+    return {"day": day, "input": input_file, "parse": parse_stats, "parts": parts}
+
+
+def format_table(reports: List[dict]) -> str:
+    """
+    Formats the reports from run_day() as a plain text table
+
+    Args:
+        reports (List[dict]): The reports returned by run_day()
+
+    Returns:
+        str: The table, one row for each parse step and part
+    """
+    header = ("Day", "Step", "Wall (ms)", "CPU (ms)", "Peak (KiB)", "Answer")
+    rows = []
+    for report in reports:
+        steps = [("Parse", None, report["parse"])]
+        steps += [(part["part"], part["answer"], part) for part in report["parts"]]
+        for step, answer, stats in steps:
+            # Multi-line answers (ex. Day 13 Part 2) are kept on one line
+            answer = "" if answer is None else str(answer).replace("\n", "\\n")
+            rows.append(
+                (
+                    str(report["day"]),
+                    step,
+                    f"{stats['wall'] * 1000:.3f}",
+                    f"{stats['cpu'] * 1000:.3f}",
+                    "-" if stats["peak"] is None else f"{stats['peak'] / 1024:.1f}",
+                    answer if len(answer) <= 24 else answer[:21] + "...",
+                )
+            )
+
+    widths = [max(len(row[i]) for row in [header] + rows) for i in range(len(header))]
+    lines = ["  ".join(cell.ljust(width) for cell, width in zip(header, widths))]
+    lines.append("  ".join("-" * width for width in widths))
+    for row in rows:
+        lines.append("  ".join(cell.ljust(width) for cell, width in zip(row, widths)))
+    return "\n".join(lines)
+
+
+def main():
+    parser = ArgumentParser(description="Runs and measures the solution for each day")
+    parser.add_argument(
+        "days", type=int, nargs="*", help="The days to run. Defaults to all days"
+    )
+    parser.add_argument(
+        "--input", help="The input file to use. Can only be used with a single day"
+    )
+    parser.add_argument("--format", choices=["table", "json"], default="table")
+    parser.add_argument(
+        "--skip-memory",
+        action="store_true",
+        help="Do not measure the peak memory, which halves the running time",
+    )
+    args = parser.parse_args()
+
+    days = args.days or sorted(PARTS.keys())
+    if args.input is not None and len(days) != 1:
+        parser.error("--input can only be used with a single day")
+    for day in days:
+        if day not in PARTS:
+            parser.error(f"There is no solution for day {day}")
+
+    reports = [
+        run_day(day, input_file=args.input, trace_memory=not args.skip_memory)
+        for day in days
+    ]
+
+    if args.format == "json":
+        # Answers are reported as strings, so that very large integers are not rounded by JSON readers
+        for report in reports:
+            for part in report["parts"]:
+                part["answer"] = str(part["answer"])
+        print(dumps(reports, indent=4))
+    else:
+        print(format_table(reports))
+
+
+if __name__ == "__main__":
+    main()